@@ -1,5 +1,17 @@
+import re
+import sys
+
+def _intern(value):
+    """
+    Intern a string so identifiers repeated across nodes share a single object,
+    any other value being returned as is.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
 class SourceFile(object):
 
+    __slots__ = ('translation_unit_list', 'filename')
+
     def __init__(self, filename = ''):
         self.translation_unit_list = []
         self.filename = filename
@@ -16,17 +28,34 @@ class Struct(object):
     """
     """
 
-    def __init__(self, identifier = '', declaration_list = [], packing = 4):
+    __slots__ = ('_identifier', 'declaration_list', 'packing')
+
+    def __init__(self, identifier = '', declaration_list = None, packing = 4):
         self.identifier       = identifier
-        self.declaration_list = declaration_list
+        self.declaration_list = declaration_list if declaration_list is not None else []
         self.packing          = packing
 
+    @property
+    def identifier(self):
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        # Parser names typedef'd and nested nodes after construction so identifiers are interned on set.
+        self._identifier = _intern(identifier)
+
     def is_incomplete(self):
         return not len(self.declaration_list)
 
     def __repr__(self):
+        return f'<{type(self).__name__} {self.identifier!r}>'
+
+    def pretty(self):
+        """
+        Render the whole node with its declarations, for debugging purpose.
+        """
         s = f'''Identifier : {self.identifier}
-                Declaration list: {self.declaration_list} 
+                Declaration list: {"".join([declaration.pretty() for declaration in self.declaration_list])} 
                 Packing: {self.packing} 
             '''
         return s
@@ -35,17 +64,33 @@ class Union(object):
     """
     """
 
-    def __init__(self, identifier = '', declaration_list = [], packing = 4):
+    __slots__ = ('_identifier', 'declaration_list', 'packing')
+
+    def __init__(self, identifier = '', declaration_list = None, packing = 4):
         self.identifier       = identifier
-        self.declaration_list = declaration_list
+        self.declaration_list = declaration_list if declaration_list is not None else []
         self.packing          = packing
 
+    @property
+    def identifier(self):
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        self._identifier = _intern(identifier)
+
     def is_incomplete(self):
         return not len(self.declaration_list)
 
     def __repr__(self):
+        return f'<{type(self).__name__} {self.identifier!r}>'
+
+    def pretty(self):
+        """
+        Render the whole node with its declarations, for debugging purpose.
+        """
         s = f'''Identifier : {self.identifier}
-                Declaration list: {self.declaration_list} 
+                Declaration list: {"".join([declaration.pretty() for declaration in self.declaration_list])} 
                 Packing: {self.packing} 
             '''
         return s
@@ -54,12 +99,19 @@ class StructDeclaration(object):
     """
     """
 
+    __slots__ = ('specifier_qualifier_list', 'struct_declarator_list')
+
     def __init__(self, specifier_qualifier_list, struct_declarator_list):
         self.specifier_qualifier_list = specifier_qualifier_list
         self.struct_declarator_list   = struct_declarator_list
 
     def __repr__(self):
-        new_line = '\n' 
+        return f'<{type(self).__name__} {self.struct_declarator_list!r}>'
+
+    def pretty(self):
+        """
+        Render the declaration as C code, for debugging purpose.
+        """
         s = f'''
                 {" ".join([str(spec_qual) for spec_qual in self.specifier_qualifier_list])} {str(self.struct_declarator_list)[1:-1]};
             '''
@@ -68,8 +120,11 @@ class StructDeclaration(object):
 class StructDeclarator(object):
     """
     """
+
+    __slots__ = ('declarator', 'bitfield')
+
     def __init__(self, declarator = '', bitfield = None):
-        self.declarator = declarator
+        self.declarator = _intern(declarator)
         self.bitfield = bitfield
 
     def __repr__(self):
@@ -77,73 +132,137 @@ class StructDeclarator(object):
 
 class Enumeration(object):
 
-    def __init__(self, identifier = '', enumerator_list = [], packing = 4):
+    __slots__ = ('_identifier', 'enumerator_list', 'packing')
+
+    def __init__(self, identifier = '', enumerator_list = None, packing = 4):
         self.identifier      = identifier
-        self.enumerator_list = enumerator_list
+        self.enumerator_list = enumerator_list if enumerator_list is not None else []
         self.packing         = packing
 
+    @property
+    def identifier(self):
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        self._identifier = _intern(identifier)
+
     def is_incomplete(self):
         return not len(self.enumerator_list)
 
     def __repr__(self):
+        return f'<{type(self).__name__} {self.identifier!r}>'
+
+    def pretty(self):
+        """
+        Render the whole node with its enumerators, for debugging purpose.
+        """
         s = f'''Identifier : {self.identifier}
                 Enumerator list : {self.enumerator_list}
                 Packing : {self.packing}'''
         return s
 
 class FunctionDefinition(object):
+
+    __slots__ = ()
     
     def __init__(self):
         pass
 
 class FunctionDeclarator(object):
+
+    __slots__ = ()
     
     def __init__(self):
         pass
 
 class Macro(object):
 
-    def __init__(self, name, replacement = '', arg_list = [], variadic = False, callback = None):
-        self.name              = name
-        self.replacement       = replacement
-        self.arg_list          = arg_list
-        self.variadic          = variadic
-        self.callback          = callback
-        self.has_been_expanded = False
+    __slots__ = ('name', 'replacement', 'arg_list', 'variadic', 'callback', 'expand', '_parameter_re')
+
+    def __init__(self, name, replacement = '', arg_list = None, variadic = False, callback = None):
+        self.name        = _intern(name)
+        self.replacement = replacement
+        self.arg_list    = arg_list if arg_list is not None else []
+        self.variadic    = variadic
+        self.callback    = callback
+
+        # Parameter pattern compiled on first expansion with arguments.
+        self._parameter_re = None
+
+        # Macro kind is fixed by its definition so expansion is bound once to the matching
+        # implementation instead of being dispatched on each call.
+        if self.callback:
+            self.expand = self._expand_callback
+        elif self.arg_list or self.variadic:
+            self.expand = self._expand_function_like
+        else:
+            self.expand = self._expand_object
+
+    def _expand_object(self, arg_list = []):
+        """
+        Expand an object-like macro.
 
-    def expand(self, arg_list = []):
+        :param      arg_list:  The argument list
+        :type       arg_list:  list
         """
-        Expand a macro. 
+        if arg_list:
+            raise Exception("Number of arguments not matching with expected list length.")
+
+        return self.replacement
+
+    def _expand_function_like(self, arg_list = []):
+        """
+        Expand a function-like macro.
 
         :param      arg_list:  The argument list
-        :type       arg_list:  { type_description }
+        :type       arg_list:  list
         """
         replacement = self.replacement
 
-        if arg_list:
-            if not self.variadic and len(arg_list) != len(self.arg_list):
-                raise Exception("Number of arguments not matching with expected list length.")
+        if not arg_list:
+            if self.arg_list:
+                raise Exception("Function like macro needs argument list.")
 
-            if self.callback:
-                raise Exception("Callback macro can't be called with user provided argument list.")
+            return replacement
 
-            for label, arg in zip(self.arg_list, arg_list): 
-                replacement = replacement.replace(label, arg)
+        if not self.variadic and len(arg_list) != len(self.arg_list):
+            raise Exception("Number of arguments not matching with expected list length.")
 
-        elif self.callback:
-            callback_return = self.callback(*self.arg_list)
-            if type(callback_return) == str:
-                replacement = f'"{callback_return}"'
-            else:
-                replacement = str(callback_return)
-        elif self.arg_list and not arg_list:
-            raise Exception("Function like macro needs argument list.")
+        # Parameters are substituted simultaneously and only as whole identifiers so an argument
+        # can't be replaced again by a following parameter.
+        if self.arg_list and replacement:
+            if self._parameter_re is None:
+                self._parameter_re = re.compile(r'\b(' + '|'.join(map(re.escape, self.arg_list)) + r')\b')
 
-        self.has_been_expanded = True
+            arguments   = dict(zip(self.arg_list, arg_list))
+            replacement = self._parameter_re.sub(lambda match: arguments.get(match.group(1), match.group(1)), replacement)
 
         return replacement
 
+    def _expand_callback(self, arg_list = []):
+        """
+        Expand a macro whose replacement is computed by its callback.
+
+        :param      arg_list:  The argument list
+        :type       arg_list:  list
+        """
+        if arg_list:
+            raise Exception("Callback macro can't be called with user provided argument list.")
+
+        callback_return = self.callback(*self.arg_list)
+        if type(callback_return) == str:
+            return f'"{callback_return}"'
+
+        return str(callback_return)
+
     def __repr__(self):
+        return f'<{type(self).__name__} {self.name!r}>'
+
+    def pretty(self):
+        """
+        Render the whole macro definition, for debugging purpose.
+        """
         s = f'''
                 Macro name: {self.name}
                 Replacement text: {self.replacement}
@@ -152,6 +271,11 @@ class Macro(object):
         return s
 
 class Declaration(object):
+
+    __slots__ = (
+                    'init_declarator_list', 'specifier_list', 'is_auto', 'is_const', 'is_extern',
+                    'is_inline', 'is_register', 'is_restrict', 'is_static', 'is_typedef', 'is_volatile',
+                )
     
     def __init__(self):
         self.init_declarator_list = []
@@ -219,10 +343,12 @@ class Declaration(object):
 
 class ArrayDeclarator(object):
 
-    def __init__(self, direct_declarator = None, length = -1, type_qualifier_list = [], is_vla = False):
+    __slots__ = ('direct_declarator', 'length', 'type_qualifier_list', 'is_vla')
+
+    def __init__(self, direct_declarator = None, length = -1, type_qualifier_list = None, is_vla = False):
         self.direct_declarator   = direct_declarator
         self.length              = length
-        self.type_qualifier_list = type_qualifier_list
+        self.type_qualifier_list = type_qualifier_list if type_qualifier_list is not None else []
         self.is_vla              = is_vla
 
     def __repr__(self):
@@ -233,9 +359,11 @@ class ArrayDeclarator(object):
 
 class Pointer(object):
 
-    def __init__(self, direct_declarator = None, reference = None, type_qualifier_list = []):
+    __slots__ = ('reference', 'type_qualifier_list', 'direct_declarator')
+
+    def __init__(self, direct_declarator = None, reference = None, type_qualifier_list = None):
         self.reference           = reference
-        self.type_qualifier_list = type_qualifier_list
+        self.type_qualifier_list = type_qualifier_list if type_qualifier_list is not None else []
         self.direct_declarator   = direct_declarator
 
     def __repr__(self):
@@ -1,5 +1,24 @@
+import os
+import warnings
 from functools import wraps
 
+# Production rules debug print is enabled at import time through the environment, otherwise
+# production rules are left undecorated so reductions don't pay an extra Python call.
+# Empty, "0", "false", "no" and "off" values (case insensitive) leave it disabled.
+DEBUG_PRODUCTIONS = os.environ.get("CPYCOMP_DEBUG_PRODUCTIONS", "").strip().lower() not in ("", "0", "false", "no", "off")
+
+def warn_debug_productions(debug):
+    """
+    Warn when a parser is created with debug enabled while production rules
+    aren't decorated, in which case no production rule would be printed.
+    
+    :param      debug:  Debug flag given to the parser
+    :type       debug:  bool
+    """
+    if debug and not DEBUG_PRODUCTIONS:
+        warnings.warn("Production rules debug print requires CPYCOMP_DEBUG_PRODUCTIONS environment variable "
+                      "to be set before import.", stacklevel = 3)
+
 def debug_production(func):
     """
     Debug print for production rules
@@ -7,6 +26,9 @@ def debug_production(func):
     :param      func:  The function
     :type       func:  { type_description }
     """
+    if not DEBUG_PRODUCTIONS:
+        return func
+
     @wraps(func)
     def inner(self, p):
         # If func is not called then production rules won't return anything.
@@ -16,4 +38,4 @@ def debug_production(func):
             print("-" * 80)
 
     inner.co_firstlineno = func.__code__.co_firstlineno
-    return inner
\ No newline at end of file
+    return inner
@@ -1,10 +1,10 @@
 LETTER       = r"[a-zA-Z]"
 DIGIT        = r"[0-9]"
 LETTER_DIGIT = r"[a-zA-Z-0-9]"
-HEX_DIGIT    = r"[a-fA-F-0-9]"
+HEX_DIGIT    = r"[a-fA-F0-9]"
 OCT_DIGIT    = r"[0-7]"
 E            = f"""[Ee][+-]?{DIGIT}+"""
 FLOAT_SUFFIX = r"[fFlL]"
-INT_SUFFIX   = r"[uUlL]"
+INT_SUFFIX   = r"(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)"
 
 COMMENT_RE = r'\/\*[\s\S]*?\*\/+|//.*'
\ No newline at end of file
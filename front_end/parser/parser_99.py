@@ -4,7 +4,7 @@ sys.path.append('../../')
 
 from collections import namedtuple
 from front_end.lexer.lexer_99 import C99Lexer
-from core.utils import debug_production
+from core.utils import debug_production, warn_debug_productions
 
 import core.intermediate_representation as ir
 import ply.yacc as yacc
@@ -28,6 +28,7 @@ class C99Parser(object):
         self.tokens        = self._lexer.tokens
         self._parser       = yacc.yacc(module = self, debug = debug, **kwargs)
         self._debug        = debug
+        warn_debug_productions(debug)
 
         self._current_enumerator_value = 0
 
@@ -1,16 +1,52 @@
+import os
 import sys
 sys.path.append("../")
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from core.utils import debug_production
+from core.utils import debug_production, warn_debug_productions
 from front_end.lexer.cregex import *
 import core.intermediate_representation as ir
 import ply.lex as lex
 import ply.yacc as yacc
+import mmap
+import operator
 import re
 import time
 
+# PLY tables are generated next to this module on first run then imported by following
+# runs, skipping grammar introspection and LALR tables computation.
+# NB: Optimized mode doesn't check tables against grammar so generated tables have to be
+# deleted whenever a token or a production rule is modified.
+TABLES_DIR     = os.path.dirname(os.path.abspath(__file__))
+TABLES_PACKAGE = f'{__package__}.' if __package__ else ''
+
+# Included headers content after translation phases 1 to 3 and their guard macro, shared by all
+# preprocessors of the process as they don't depend on any macro. Keyed by preprocessor class, resolved
+# path and comment handling, stored along file modification time and size to detect changes.
+# Least recently used headers are evicted once TRANSLATED_HEADERS_MAX entries are cached.
+TRANSLATED_HEADERS_MAX = 256
+_translated_headers    = OrderedDict()
+
+def clear_translated_headers():
+    """
+    Clear translated headers shared by all preprocessors of the process.
+    """
+    _translated_headers.clear()
+
+# Keywords, never mutated so shared by all lexers.
+RESERVED = {
+                "#define" : "DEFINE", "defined" : "DEFINED", "#elif" : "ELIF", "#else" : "ELSE",
+                "#endif" : "ENDIF", "#error" : "ERROR", "#if" : "IF", "#ifdef" : "IFDEF",
+                "#ifndef" : "IFNDEF", "#include" : "INCLUDE", "#line" : "LINE", "#pragma" : "PRAGMA",
+                "_Pragma" : "_PRAGMA", "#undef" : "UNDEF",
+           }
+
+# Directive token types opening an if section.
+IF_TYPES = frozenset(("IF", "IFDEF", "IFNDEF"))
+
 
 class C99PreProcessorLexer(object):
     """
@@ -18,12 +54,7 @@ class C99PreProcessorLexer(object):
     """
 
     # Keywords
-    reserved = {
-                    "#define" : "DEFINE", "defined" : "DEFINED", "#elif" : "ELIF", "#else" : "ELSE",
-                    "#endif" : "ENDIF", "#error" : "ERROR", "#if" : "IF", "#ifdef" : "IFDEF",
-                    "#ifndef" : "IFNDEF", "#include" : "INCLUDE", "#line" : "LINE", "#pragma" : "PRAGMA",
-                    "_Pragma" : "_PRAGMA", "#undef" : "UNDEF",
-                }
+    reserved = RESERVED
 
     # This class attribute should be set because ply
     # is using Python introspection for its internal
@@ -81,9 +112,13 @@ class C99PreProcessorLexer(object):
              )
 
     def __init__(self, **kwargs):
-        self._lexer    = lex.lex(module = self, reflags=re.UNICODE, **kwargs)
+        self._lexer    = lex.lex(module = self, reflags=re.UNICODE, optimize = 1, lextab = f'{TABLES_PACKAGE}c99pp_lextab',
+                                 outputdir = TABLES_DIR, **kwargs)
         self.nested_if = 0
 
+        # Child lexers released after a rescan, reused by following rescans.
+        self._child_pool = []
+
     # Define a rule so we can track line numbers
     def t_NEWLINE(self, t):
         r'\n+'
@@ -104,14 +139,20 @@ class C99PreProcessorLexer(object):
         r'\#[a-zA-Z_][a-zA-Z_0-9]*'
 
         t.lexer.begin("directive")
+        t.value = sys.intern(t.value)
 
         # Check first if it's a standard C directive
-        if t.value in self.reserved:
-            t.type = self.reserved[t.value]
+        reserved_type = RESERVED.get(t.value)
+
+        if reserved_type:
+            t.type = reserved_type
             
-            if t.type == "IF" or t.type == 'IFDEF' or t.type == 'IFNDEF':
+            if reserved_type in IF_TYPES:
                 self.nested_if += 1
-            elif t.type == "ENDIF":
+                # Parser reads a token ahead of reductions, nesting of an if section is kept on its opening
+                # directive so it doesn't depend on the following directives already read.
+                t.nested_if = self.nested_if
+            elif reserved_type == "ENDIF":
                 self.nested_if -= 1
 
                 if self.nested_if < 0:
@@ -121,74 +162,40 @@ class C99PreProcessorLexer(object):
 
     def t_IDENTIFIER(self, t):
         r'[a-zA-Z_][a-zA-Z_0-9]*'
+        # Identifiers are interned so macro table lookups mostly compare strings by identity.
+        t.value = sys.intern(t.value)
         return t
 
     def t_STRING_LITERAL(self, t):
         r'L?"(\\.|[^\\\"])*"'
         return t
 
-    FLOAT_RE = fr'({DIGIT}+{E}|{DIGIT}*\.{DIGIT}+({E})?|{DIGIT}+\.{DIGIT}*({E})?)(?P<float_suffix>{FLOAT_SUFFIX})?'
-    @lex.TOKEN(FLOAT_RE)
-    def t_FLOAT(self, t):
-        # Float values are constant but defined as a single rule
-        # to allow easier conversion from Python str to float.
-        
-        # TODO: Handle suffix
-        # PLY mix all token regexes into a single big regex with captured group
-        # so we can't rely on group position. So we are defining named group to ease
-        # trimming of suffixes.
-        # 
-        # We are testing all named suffixes for float because Python doesn't allow reuse
-        # of same name.
-        suffix = t.lexer.lexmatch.group('float_suffix')
-        t.value = float(t.value.rstrip(suffix))
-        t.type  = "CONSTANT"
-        return t    
-    
-    HEX_RE = fr'0[xX]{HEX_DIGIT}+(?P<hex_suffix>{INT_SUFFIX})?'
-    @lex.TOKEN(HEX_RE)
-    def t_HEX(self, t):
-        # Hex values are constant but defined as a single rule
-        # to allow easier conversion from Python str to hex.
-        
-        # TODO: Handle suffix
-        # PLY mix all token regexes into a single big regex with captured group
-        # so we can't rely on group position. So we are defining named group to ease
-        # trimming of suffixes.
-        suffix = t.lexer.lexmatch.group('hex_suffix')
-        t.value = int(t.value.rstrip(suffix), base = 16)
-        t.type = "CONSTANT"
-        return t
+    # Numeric constants are matched by a single rule, the named group of the matching
+    # alternative tells how to convert it and excludes its suffix.
+    # Alternatives are ordered so that floats are tried before octal and integer constants
+    # sharing the same leading digits.
+    CONSTANT_RE = "|".join([
+                                fr'(?P<hex_constant>0[xX]{HEX_DIGIT}+){INT_SUFFIX}?',
+                                fr'(?P<float_constant>{DIGIT}+{E}|{DIGIT}*\.{DIGIT}+(?:{E})?|{DIGIT}+\.{DIGIT}*(?:{E})?){FLOAT_SUFFIX}?',
+                                fr'(?P<oct_constant>0{OCT_DIGIT}+){INT_SUFFIX}?',
+                                fr'(?P<int_constant>{DIGIT}+){INT_SUFFIX}?',
+                            ])
 
-    OCT_RE = fr'0{OCT_DIGIT}+(?P<oct_suffix>{INT_SUFFIX})?'
-    @lex.TOKEN(OCT_RE)
-    def t_OCTAL(self, t):
-        # Octal values are constant but defined as a single rule
-        # to allow easier conversion from Python str to octal.
-        
-        # TODO: Handle suffix
+    @lex.TOKEN(CONSTANT_RE)
+    def t_CONSTANT(self, t):
         # PLY mix all token regexes into a single big regex with captured group
-        # so we can't rely on group position. So we are defining named group to ease
-        # trimming of suffixes.
-        suffix = t.lexer.lexmatch.group('oct_suffix')
+        # so we can't rely on group position, named groups are used instead.
+        match = t.lexer.lexmatch
+
+        if match.group('hex_constant'):
+            t.value = int(match.group('hex_constant'), base = 16)
+        elif match.group('float_constant'):
+            t.value = float(match.group('float_constant'))
+        elif match.group('oct_constant'):
+            t.value = int(match.group('oct_constant'), base = 8)
+        else:
+            t.value = int(match.group('int_constant'))
 
-        t.value = int(t.value.rstrip(suffix), base = 8)
-        t.type = "CONSTANT"
-        return t
-
-    INTEGER_RE = fr'{DIGIT}+(?P<int_suffix>{INT_SUFFIX})?'
-    @lex.TOKEN(INTEGER_RE)
-    def t_INTEGER(self, t):
-        # Integer values are constant but defined as a single rule
-        # to allow easier conversion from Python str to int. 
-
-        # TODO: Handle suffix
-        # PLY mix all token regexes into a single big regex with captured group
-        # so we can't rely on group position. So we are defining named group to ease
-        # trimming of suffixes.
-        suffix = t.lexer.lexmatch.group('int_suffix')
-        t.value = int(t.value.rstrip(suffix))
-        t.type = "CONSTANT"
         return t
 
     def t_LITERAL(self, t):
@@ -229,23 +236,191 @@ class C99PreProcessorLexer(object):
         print("Illegal character '%s'" % t.value[0])
         t.lexer.skip(1)
 
+    def make_child(self):
+        """
+        Create a lexer sharing compiled rules and current state of this lexer,
+        used to rescan some text without interfering with current tokenization.
+        """
+        # Lexer state is only made of plain attributes so copying them is enough,
+        # it avoids the copy protocol overhead of Lexer.clone on each rescan.
+        child = self._child_pool.pop() if self._child_pool else lex.Lexer.__new__(lex.Lexer)
+        child.__dict__.update(self._lexer.__dict__)
+
+        return child
+
+    def release_child(self, child):
+        """
+        Give back a child lexer once its text has been consumed so it can be
+        reused by a following rescan.
+        """
+        # Rescanned text isn't needed anymore, it shouldn't be kept alive by the pool
+        # neither through lexer data nor through the last match.
+        child.lexdata  = None
+        child.lexmatch = None
+        self._child_pool.append(child)
+
     def tokenize(self, data):
         """
         Parse data and returns a token list.
         """
-        token_list = []
-
         self._lexer.input(data)
 
+        # Lexer returns None once input is exhausted so the token loop
+        # can be driven by the builtin iterator instead of bytecode.
+        return list(iter(self._lexer.token, None))
+
+def _c_divide(left, right):
+    # C integer division truncates toward zero whereas Python floor division rounds toward negative infinity.
+    if isinstance(left, int) and isinstance(right, int):
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+
+    return left / right
+
+def _c_modulo(left, right):
+    return left - right * _c_divide(left, right)
+
+# C relational and equality operators yield an int (1 or 0) whereas Python ones yield a bool.
+def _c_equal(left, right):
+    return int(left == right)
+
+def _c_not_equal(left, right):
+    return int(left != right)
+
+def _c_less(left, right):
+    return int(left < right)
+
+def _c_greater(left, right):
+    return int(left > right)
+
+def _c_less_equal(left, right):
+    return int(left <= right)
+
+def _c_greater_equal(left, right):
+    return int(left >= right)
+
+class C99ConstantExpression(object):
+    """
+    Evaluate a preprocessor constant expression (#if/#elif) by precedence
+    climbing over the token values, defined operators and macros having
+    already been replaced.
+    """
+
+    # Binary operators precedence, higher value binds tighter.
+    binary_precedence = {
+                            '||' : 1, '&&' : 2, '|' : 3, '^' : 4, '&' : 5,
+                            '==' : 6, '!=' : 6, '<' : 7, '>' : 7, '<=' : 7, '>=' : 7,
+                            '<<' : 8, '>>' : 8, '+' : 9, '-' : 9, '*' : 10, '/' : 10, '%' : 10,
+                        }
+
+    # Binary operators semantic, logical operators are handled apart as they short-circuit.
+    binary_operators = {
+                            '|' : operator.or_, '^' : operator.xor, '&' : operator.and_,
+                            '==' : _c_equal, '!=' : _c_not_equal, '<' : _c_less, '>' : _c_greater,
+                            '<=' : _c_less_equal, '>=' : _c_greater_equal, '<<' : operator.lshift, '>>' : operator.rshift,
+                            '+' : operator.add, '-' : operator.sub, '*' : operator.mul, '/' : _c_divide, '%' : _c_modulo,
+                       }
+
+    def __init__(self, token_list):
+        self._token_list = token_list
+        self._position   = 0
+
+    def evaluate(self):
+        """
+        Evaluate the constant expression.
+        """
+        value = self._conditional_expression(True)
+
+        if self._position != len(self._token_list):
+            raise Exception(f'Unexpected token {self._token_list[self._position]} in constant expression.')
+
+        return value
+
+    def _peek(self):
+        if self._position < len(self._token_list):
+            return self._token_list[self._position]
+
+        return None
+
+    def _next(self):
+        token = self._peek()
+
+        if token is None:
+            raise Exception("Unexpected end of constant expression.")
+
+        self._position += 1
+        return token
+
+    def _expect(self, expected_token):
+        token = self._next()
+
+        if token != expected_token:
+            raise Exception(f'Expected {expected_token} in constant expression but got {token}.')
+
+    def _conditional_expression(self, is_evaluated):
+        """
+        Parse a conditional expression, operands of a non evaluated branch
+        are parsed without being computed (e.g. 0 && 1 / 0 is valid).
+
+        :param      is_evaluated:  Whether the expression value is computed
+        :type       is_evaluated:  bool
+        """
+        condition = self._binary_expression(1, is_evaluated)
+
+        if self._peek() != '?':
+            return condition
+
+        self._position += 1
+        true_value  = self._conditional_expression(is_evaluated and bool(condition))
+        self._expect(':')
+        false_value = self._conditional_expression(is_evaluated and not condition)
+
+        return true_value if condition else false_value
+
+    def _binary_expression(self, min_precedence, is_evaluated):
+        left = self._unary_expression(is_evaluated)
+
         while True:
-            tok = self._lexer.token()
-            
-            if not tok:
-                break
+            binary_operator = self._peek()
+            precedence      = self.binary_precedence.get(binary_operator, 0) if isinstance(binary_operator, str) else 0
+
+            if precedence < min_precedence:
+                return left
 
-            token_list.append(tok)
+            self._position += 1
 
-        return token_list
+            if binary_operator == '&&':
+                right = self._binary_expression(precedence + 1, is_evaluated and bool(left))
+                left  = int(bool(left) and bool(right))
+            elif binary_operator == '||':
+                right = self._binary_expression(precedence + 1, is_evaluated and not left)
+                left  = int(bool(left) or bool(right))
+            else:
+                right = self._binary_expression(precedence + 1, is_evaluated)
+                left  = self.binary_operators[binary_operator](left, right) if is_evaluated else 0
+
+    def _unary_expression(self, is_evaluated):
+        token = self._next()
+
+        if token == '(':
+            value = self._conditional_expression(is_evaluated)
+            self._expect(')')
+            return value
+        elif token == '+':
+            return self._unary_expression(is_evaluated)
+        elif token == '-':
+            return -self._unary_expression(is_evaluated)
+        elif token == '~':
+            return ~self._unary_expression(is_evaluated)
+        elif token == '!':
+            return int(not self._unary_expression(is_evaluated))
+        elif isinstance(token, (int, float)):
+            return token
+        elif token.isidentifier():
+            # Remaining identifiers aren't macros and are replaced by 0 (C99 6.10.1.3).
+            return 0
+
+        raise Exception(f'Unexpected token {token} in constant expression.')
 
 class C99PreProcessor(object):
 
@@ -255,15 +430,41 @@ class C99PreProcessor(object):
         self._lexer = C99PreProcessorLexer()
         self.tokens = self._lexer.tokens
 
-        self.headers_table = {}
-        self.macro         = {} 
+        # Preprocessed headers and their guard macro keyed by resolved path.
+        self.headers_table  = {}
+        self._header_guards = {}
+
+        # Header paths as found along their resolved path (None when not found) keyed by header name and,
+        # for quoted names, the directory they are searched from.
+        self._include_paths = {}
+
+        # File names (and their casefolded version) of directories searched for headers, keyed by directory.
+        self._dir_index = {}
+        self.macro          = {} 
 
-        self.define_macro("__DATE__", callback = time.strftime, arg_list = ["%b %d %Y"])
+        # Expansions computed outside of any other macro expansion, keyed by macro name and argument list.
+        self._expansion_cache       = {}
+        self._is_expansion_volatile = False
+
+        # Names of macros being expanded, a macro found in its own rescan isn't replaced again (C99 6.10.3.4).
+        self._hideset = frozenset()
+
+        # Date and time of translation are constant during a run (C99 6.10.8) so they are plain object-like macros.
+        self.define_macro("__DATE__", replacement = f'"{time.strftime("%b %d %Y")}"')
         self.define_macro("__FILE__", callback = self.get_current_filename)
         self.define_macro("__LINE__", callback = self.get_lineno)
-        self.define_macro("__TIME__", callback = time.strftime, arg_list = ["%H:%M:%S"])
-
-        self._parser = yacc.yacc(module = self, debug = debug, start = "preprocessing_file", **kwargs)
+        self.define_macro("__TIME__", replacement = f'"{time.strftime("%H:%M:%S")}"')
+
+        # Builtin macros depending on the current position are resolved directly, bypassing macro
+        # expansion and rescan of their replacement.
+        self._builtin_macros = {
+                                    "__FILE__" : lambda: f'"{self.get_current_filename()}"',
+                                    "__LINE__" : lambda: str(self.get_lineno()),
+                               }
+
+        # Debug output of yacc is disabled as grammar isn't checked in optimized mode.
+        self._parser = yacc.yacc(module = self, debug = False, optimize = 1, tabmodule = f'{TABLES_PACKAGE}c99pp_parsetab',
+                                 write_tables = 1, outputdir = TABLES_DIR, start = "preprocessing_file", **kwargs)
         self._di_tri_graph_replace_table =  {
                                                 # Digraph
                                                 '<:' : '[', '>:' : ']', '<%' : '{', '>%' : '}', '%:' : '#',  
@@ -273,15 +474,35 @@ class C99PreProcessor(object):
                                                 '??-' : '~',
                                             }
 
+        # Longest sequences are matched first so trigraphs can't be shadowed by a shorter prefix,
+        # this allows replacing all digraphs/trigraphs in a single pass over the file content.
+        self._di_tri_graph_re = re.compile('|'.join([re.escape(di_trigraph) for di_trigraph in
+                                                     sorted(self._di_tri_graph_replace_table, key = len, reverse = True)]))
+
+        # Most files don't contain any digraph/trigraph. Each of them holds at least one of these
+        # characters which are searched first, a single character lookup being a plain memchr.
+        self._di_tri_graph_chars = ('?', ':', '%')
+        self._comment_re      = re.compile(COMMENT_RE)
+
+        # Header guard opening (#ifndef X followed by #define X) and conditional directives used to
+        # check the guard if section spans the whole header.
+        self._header_guard_re = re.compile(r'\A\s*#ifndef[ \t]+([a-zA-Z_][a-zA-Z_0-9]*)[ \t]*\n\s*#define[ \t]+\1\b')
+        self._conditional_re  = re.compile(r'^[ \t]*#(if|ifdef|ifndef|elif|else|endif)\b', re.MULTILINE)
+
         if not stdlib_path:
-            self._stdlib_path = ["stdlib/",]
-        else:
-            self._stdlib_path = stdlib_path
+            stdlib_path = ["stdlib/",]
+
+        # Stdlib directories are converted once as they are joined with every included header name.
+        self._stdlib_path = tuple(Path(std_dir) for std_dir in stdlib_path)
 
         self._keep_comment       = keep_comment
         self._debug              = debug
+        warn_debug_productions(debug)
         self._discard_next_paren = False
 
+        # Whether a branch has been taken for each if section being parsed, innermost last.
+        self._if_taken = []
+
     """
     Preprocessor production rules + semantics actions
     """
@@ -292,7 +513,7 @@ class C99PreProcessor(object):
                            | group
         '''
         if len(p) == 2:
-            p[0] = p[1]
+            p[0] = ''.join(p[1][0])
         else:
             p[0] = ''
 
@@ -300,13 +521,20 @@ class C99PreProcessor(object):
     def p_group(self, p):
         '''
         group : group_part
-              | group group_part
         '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            # No whitespace should be put between group/group_part, each group being separated by a newline
-            p[0] = f'{p[1]}{p[2]}'
+        # Groups are stored as (parts, needs_rescan) tuples, needs_rescan being set when the text holds directives
+        # which haven't been executed because they were parsed inside an if section.
+        # Parts are accumulated in a list which is joined once by the rule consuming the group.
+        p[0] = ([p[1][0]], p[1][1])
+
+    @debug_production
+    def p_group_2(self, p):
+        '''
+        group : group group_part
+        '''
+        # No whitespace should be put between group/group_part, each group being separated by a newline
+        p[1][0].append(p[2][0])
+        p[0] = (p[1][0], p[1][1] or p[2][1])
 
     @debug_production
     def p_group_part(self, p):
@@ -328,30 +556,26 @@ class C99PreProcessor(object):
                      | pragma_directive NEWLINE
                      | undef_directive NEWLINE
         '''
-        p[0] = f'{p[1]}\n'
+        p[0] = (f'{p[1]}\n', True)
 
     @debug_production
     def p_if_section(self, p):
         '''
         if_section  : if_group endif_line
         '''
-        if_block = '\n'
+        if_block = (['\n'], False)
 
         if p[1][0]:
             if_block = p[1][1]
         
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._close_if_section(p, if_block)
 
     @debug_production
     def p_if_section2(self, p):
         '''
         if_section  : if_group elif_groups endif_line
         '''
-        if_block = '\n'
+        if_block = (['\n'], False)
 
         if p[1][0]:
             if_block = p[1][1]
@@ -361,29 +585,21 @@ class C99PreProcessor(object):
                     if_block = elif_group[1]
                     break
 
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._close_if_section(p, if_block)
 
     @debug_production
     def p_if_section3(self, p):
         '''
         if_section  : if_group else_group endif_line
         '''
-        if_block = '\n'
+        if_block = (['\n'], False)
 
         if p[1][0]:
             if_block = p[1][1]
         else:
             if_block = p[2]
 
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:            
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._close_if_section(p, if_block)
 
     @debug_production
     def p_if_section4(self, p):
@@ -406,11 +622,7 @@ class C99PreProcessor(object):
         if not block_evaluated:
             if_block = p[3]
 
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._close_if_section(p, if_block)
 
     @debug_production
     def p_if_group(self, p):
@@ -418,13 +630,14 @@ class C99PreProcessor(object):
         if_group : IF constant_expression NEWLINE
                  | IF constant_expression NEWLINE group
         '''
-        group = ''
+        group = ([], False)
 
         if p[2]:
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (p[2], group)
+        self._if_taken.append(bool(p[2]))
+        p[0] = (p[2], group, p.slice[1])
 
     @debug_production
     def p_if_group2(self, p):
@@ -432,7 +645,7 @@ class C99PreProcessor(object):
         if_group : IFDEF IDENTIFIER NEWLINE
                  | IFDEF IDENTIFIER NEWLINE group
         '''
-        group = ''
+        group = ([], False)
         is_defined = False
 
         if p[2] in self.macro:
@@ -440,7 +653,8 @@ class C99PreProcessor(object):
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (is_defined, group)
+        self._if_taken.append(is_defined)
+        p[0] = (is_defined, group, p.slice[1])
 
     @debug_production
     def p_if_group3(self, p):
@@ -448,7 +662,7 @@ class C99PreProcessor(object):
         if_group : IFNDEF IDENTIFIER NEWLINE
                  | IFNDEF IDENTIFIER NEWLINE group
         '''
-        group = ''
+        group = ([], False)
         is_defined = True
 
         if p[2] not in self.macro:
@@ -456,29 +670,35 @@ class C99PreProcessor(object):
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (not is_defined, group)
+        self._if_taken.append(not is_defined)
+        p[0] = (not is_defined, group, p.slice[1])
 
     @debug_production
     def p_elif_groups(self, p):
         '''
         elif_groups : elif_group
-                    | elif_groups elif_group
         '''
-        if len(p) == 2:
-            p[0] = [p[1]]
-        elif len(p) == 3:
-            p[1].append(p[2])
-            p[0] = p[1]
+        p[0] = [p[1]]
+
+    @debug_production
+    def p_elif_groups_2(self, p):
+        '''
+        elif_groups : elif_groups elif_group
+        '''
+        p[1].append(p[2])
+        p[0] = p[1]
 
     @debug_production
     def p_elif_group(self, p):
         '''
-        elif_group : ELIF constant_expression NEWLINE
-                   | ELIF constant_expression NEWLINE group
+        elif_group : ELIF elif_expression NEWLINE
+                   | ELIF elif_expression NEWLINE group
         '''
-        group = ''
+        group = ([], False)
 
         if p[2]:
+            if self._if_taken:
+                self._if_taken[-1] = True
             if len(p) == 5:
                 group = p[4]
 
@@ -490,7 +710,7 @@ class C99PreProcessor(object):
         else_group : ELSE NEWLINE
                    | ELSE NEWLINE group
         '''
-        group = ''
+        group = ([], False)
 
         if len(p) == 4:
             group = p[3]
@@ -502,7 +722,8 @@ class C99PreProcessor(object):
         '''
         endif_line : ENDIF NEWLINE
         '''
-        p[0] = '\n'
+        # End position of the if section, used to give it back as is when it's nested in another one.
+        p[0] = p.lexpos(2) + len(p[2])
 
     @debug_production
     def p_define_directive(self, p):
@@ -532,10 +753,10 @@ class C99PreProcessor(object):
         define_directive : DEFINE IDENTIFIER LPAREN identifier_list ')' replacement_list
         '''
         if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[6], arg_list = p[4].split(','))
+            self.define_macro(p[2], replacement = p[6], arg_list = p[4])
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]}({p[4]}) {p[6]}'
+            p[0] = f'{p[1]} {p[2]}({",".join(p[4])}) {p[6]}'
 
     @debug_production
     def p_define_directive_4(self, p):
@@ -554,10 +775,10 @@ class C99PreProcessor(object):
         define_directive : DEFINE IDENTIFIER LPAREN identifier_list ',' ELLIPSIS ')' replacement_list
         '''
         if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[8], arg_list = p[4].split(','), variadic = True)
+            self.define_macro(p[2], replacement = p[8], arg_list = p[4], variadic = True)
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]}({p[4]},...) {p[8]}'
+            p[0] = f'{p[1]} {p[2]}({",".join(p[4])},...) {p[8]}'
 
     @debug_production
     def p_error_directive(self, p):
@@ -569,31 +790,34 @@ class C99PreProcessor(object):
             if len(p) == 2:
                 raise Exception()
             elif len(p) == 3:
-                raise Exception(p[2])
+                raise Exception(' '.join([str(t) for t in p[2]]))
         else:
-            p[0] = f'{p[1]} {p[2] if len(p) == 2 else ""}'
+            p[0] = f'{p[1]} {" ".join([str(t) for t in p[2]]) if len(p) == 3 else ""}'
 
     @debug_production
     def p_include_directive(self, p):
         '''
         include_directive : INCLUDE token_list
         '''
+        header_name = ' '.join([str(t) for t in p[2]])
+
         if not self._lexer.nested_if:
-            p[0] = self.include(p[2])
+            p[0] = self.include(header_name)
         else:
-            p[0] = f'{p[1]} {p[2]}'
+            p[0] = f'{p[1]} {header_name}'
 
     @debug_production
     def p_line_directive(self, p):
         '''
         line_directive : LINE token_list
         '''
+        line = ' '.join([str(t) for t in p[2]])
+
         if not self._lexer.nested_if:
-            p[2] = str(p[2])
-            token_list = p[2].split(' ')
+            token_list = line.split(' ')
             p[0] = self.lineno_update(token_list)
         else:
-            p[0] = f'{p[1]} {p[2]}'
+            p[0] = f'{p[1]} {line}'
 
     @debug_production
     def p_pragma_directive(self, p):
@@ -604,6 +828,8 @@ class C99PreProcessor(object):
         '''
         if not self._lexer.nested_if:
             p[0] = self.pragma(p[1:])
+        elif len(p) == 3:
+            p[0] = ' '.join([p[1]] + [str(t) for t in p[2]])
         else:
             p[0] = ' '.join(p[1:])
 
@@ -619,182 +845,56 @@ class C99PreProcessor(object):
             p[0] = f'{p[1]} {p[2]}'
     
     @debug_production
-    def p_primary_expression(self, p):
-        '''primary_expression : IDENTIFIER
+    def p_constant_expression(self, p):
         '''
-        if p[1] in self.macro:
-            replacement = self.expand_macro(p[1])
-            p[0] = replacement if replacement != None else p[1]
-        else:
-            p[0] = p[1]
-
-    @debug_production
-    def p_primary_expression2(self, p):
-        '''primary_expression : CONSTANT'''
-        p[0] = p[1]
-
-    @debug_production
-    def p_primary_expression3(self, p):
-        '''primary_expression : '(' constant_expression ')' '''
-        p[0] = p[2]
-
-    @debug_production
-    def p_unary_expression(self, p):
-        '''unary_expression : primary_expression
-                            | unary_operator unary_expression
-                            | DEFINED '(' IDENTIFIER ')' '''
-        if len(p) == 2:
-            p[0] = p[1]
-        elif len(p) == 3:
-            p[0] = p[1], p[2]
-        else:
-            p[0] = True if p[3] in self.macro else False
-
-    @debug_production
-    def p_unary_operator(self, p):
-        '''unary_operator : '&'
-                          | '*'  
-                          | '+'  
-                          | '-'  
-                          | '~'  
-                          | '!' '''
-        p[0] = p[1]
-
-    @debug_production
-    def p_multiplicative_expression(self, p):
-        '''multiplicative_expression : unary_expression
-                                     | multiplicative_expression '*' unary_expression
-                                     | multiplicative_expression '/' unary_expression
-                                     | multiplicative_expression '%' unary_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '*':
-                p[0] = p[1] * p[3]
-            elif p[2] == '/':
-                p[0] = p[1] / p[3]
-            elif p[2] == '%':
-                p[0] = p[1] % p[3]
-
-    @debug_production
-    def p_additive_expression(self, p):
-        '''additive_expression : multiplicative_expression
-                               | additive_expression '+' multiplicative_expression
-                               | additive_expression '-' multiplicative_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '+':
-                p[0] = p[1] + p[3]
-            elif p[2] == '-':
-                p[0] = p[1] - p[3]
-
-    @debug_production
-    def p_shift_expression(self, p):
-        '''shift_expression : additive_expression
-                            | shift_expression LEFT_OP additive_expression
-                            | shift_expression RIGHT_OP additive_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '<<':
-                p[0] = p[1] << p[3]
-            elif p[2] == '>>':
-                p[0] = p[1] >> p[3]
-
-    @debug_production
-    def p_relational_expression(self, p):
-        '''relational_expression : shift_expression
-                                 | relational_expression '<' shift_expression
-                                 | relational_expression '>' shift_expression
-                                 | relational_expression LE_OP shift_expression
-                                 | relational_expression GE_OP shift_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '<':
-                p[0] = p[1] < p[3]
-            elif p[2] == '>':
-                p[0] = p[1] > p[3]
-            elif p[2] == '<=':
-                p[0] = p[1] <= p[3]
-            elif p[2] == '>=':
-                p[0] = p[1] >= p[3]
-
-    @debug_production
-    def p_equality_expression(self, p):
-        '''equality_expression : relational_expression
-                               | equality_expression EQ_OP relational_expression
-                               | equality_expression NE_OP relational_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '==':
-                p[0] = p[1] == p[3]
-            elif p[2] == '!=':
-                p[0] = p[1] != p[3]
-
-    @debug_production
-    def p_and_expression(self, p):
-        '''and_expression : equality_expression
-                          | and_expression '&' equality_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] & p[3]
-
-    @debug_production
-    def p_exclusive_or_expression(self, p):
-        '''exclusive_or_expression : and_expression
-                                   | exclusive_or_expression '^' and_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] ^ p[3]
-
-    @debug_production
-    def p_inclusive_or_expression(self, p):
-        '''inclusive_or_expression : exclusive_or_expression
-                                   | inclusive_or_expression '|' exclusive_or_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
+        constant_expression : if_token_list
+        '''
+        # Conditions of a nested if section are evaluated by the rescan of the enclosing group,
+        # once the directives preceding them have been executed.
+        if self._lexer.nested_if > 1:
+            p[0] = 0
         else:
-            p[0] = p[1] | p[3]
+            p[0] = self._evaluate_condition(p[1])
 
     @debug_production
-    def p_logical_and_expression(self, p):
-        '''logical_and_expression : inclusive_or_expression
-                                  | logical_and_expression AND_OP inclusive_or_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
+    def p_elif_expression(self, p):
+        '''
+        elif_expression : if_token_list
+        '''
+        # Once a branch of the if section has been taken following #elif conditions aren't evaluated,
+        # neither are conditions of a nested if section.
+        if self._lexer.nested_if > 1 or (self._if_taken and self._if_taken[-1]):
+            p[0] = 0
         else:
-            p[0] = p[1] and p[3]
+            p[0] = self._evaluate_condition(p[1])
 
     @debug_production
-    def p_logical_or_expression(self, p):
+    def p_if_token_list(self, p):
         '''
-        logical_or_expression : logical_and_expression
-                              | logical_or_expression OR_OP logical_and_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] or p[2]
+        if_token_list : if_token
+        '''
+        p[0] = [p[1]]
 
     @debug_production
-    def p_conditional_expression(self, p ):
+    def p_if_token_list_2(self, p):
         '''
-        conditional_expression : logical_or_expression
-                               | logical_or_expression '?' conditional_expression ':' conditional_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] if p[2] else p[3] 
+        if_token_list : if_token_list if_token
+        '''
+        p[1].append(p[2])
+        p[0] = p[1]
 
     @debug_production
-    def p_constant_expression(self, p):
+    def p_if_token(self, p):
         '''
-        constant_expression : conditional_expression
+        if_token : IDENTIFIER
+                 | DEFINED
+                 | CONSTANT
+                 | STRING_LITERAL
+                 | HEADER_NAME
+                 | LPAREN
+                 | operator_punc
         '''
+        # Tokens are kept unexpanded so defined operator can be applied before macro replacement.
         p[0] = p[1]
 
     @debug_production
@@ -803,24 +903,32 @@ class C99PreProcessor(object):
         text_line : NEWLINE
                   | token_list NEWLINE
         '''
-        p[0] = ' '.join([str(t) for t in p[1:]])
+        if len(p) == 2:
+            p[0] = (p[1], False)
+        else:
+            p[0] = (' '.join([str(t) for t in p[1]] + [p[2]]), False)
 
     def p_conditionally_supported_directive(self, p):
         '''
         conditionally_supported_directive : DIRECTIVE token_list NEWLINE
         '''
-        p[0] = '\n'
+        p[0] = ('\n', False)
     
     @debug_production
     def p_identifier_list(self, p):
         '''
         identifier_list : IDENTIFIER
-                        | identifier_list ',' IDENTIFIER
         '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = ''.join(p[1:])
+        # Parameters are kept as a list so they can be handed over as is to macro definition.
+        p[0] = [p[1]]
+
+    @debug_production
+    def p_identifier_list_2(self, p):
+        '''
+        identifier_list : identifier_list ',' IDENTIFIER
+        '''
+        p[1].append(p[3])
+        p[0] = p[1]
 
     @debug_production
     def p_replacement_list(self, p):
@@ -829,31 +937,34 @@ class C99PreProcessor(object):
                          | token_list
         '''
         if len(p) == 2:
-            p[0] = p[1]
+            p[0] = ' '.join([str(t) for t in p[1]])
 
     @debug_production
     def p_token_list(self, p):
         '''
         token_list : token
-                   | token_list token
         '''
-        if len(p) == 2:
-            p[0] = p[1]
+        # Tokens are accumulated in a list which is joined once by the rule consuming the token list.
+        p[0] = [p[1]]
+
+    @debug_production
+    def p_token_list_2(self, p):
+        '''
+        token_list : token_list token
+        '''
+        # TODO: Check if there's a better way to skip open parenthesis once function-like macro
+        # has been expanded.
+        # 
+        # HACK: Because we are looking ahead for function-like macro expansion and PLY internally
+        # return matched '(' which is done before identifier is being expanded.
+        # So to know we need to skip it a boolean is set when function-like macro is
+        # expanded.
+        if self._discard_next_paren and p[2] == '(':
+            self._discard_next_paren = False
         else:
-            tokens = p[1:]
-            
-            # TODO: Check if there's a better way to skip open parenthesis once function-like macro
-            # has been expanded.
-            # 
-            # HACK: Because we are looking ahead for function-like macro expansion and PLY internally
-            # return matched '(' which is done before identifier is being expanded.
-            # So to know we need to skip it a boolean is set when function-like macro is
-            # expanded.
-            if self._discard_next_paren and tokens[1] == '(':
-                tokens.pop()
-                self._discard_next_paren = False
-
-            p[0] = ' '.join([str(t) for t in tokens])
+            p[1].append(p[2])
+
+        p[0] = p[1]
 
     def p_token(self, p):
         '''
@@ -986,6 +1097,51 @@ class C99PreProcessor(object):
         """
         return self._parser.parse(data, lexer = lexer)
 
+    def _close_if_section(self, p, if_block):
+        """
+        Close an if section, giving back the text of its taken block.
+        
+        :param      p:         The if section production
+        :type       p:         YaccProduction
+        :param      if_block:  The taken block, as a (parts, needs_rescan) tuple
+        :type       if_block:  tuple
+
+        :returns:   The if section text and whether it needs to be rescanned
+        :rtype:     tuple
+        """
+        # Guarded as error recovery of the parser might have discarded the matching if group.
+        if self._if_taken:
+            self._if_taken.pop()
+
+        # A nested if section has been parsed before directives of the enclosing group are executed,
+        # so its source text is given back as is to be evaluated by the rescan of the enclosing group.
+        if_token = p[1][2]
+
+        if if_token.nested_if > 1:
+            return (p.lexer.lexdata[if_token.lexpos:p[len(p) - 1]], True)
+
+        # Block without any directive has already been fully expanded so it's kept as is.
+        if_text = ''.join(if_block[0])
+
+        if if_block[1]:
+            if_text = self._rescan(if_text)
+
+        return (if_text, if_block[1])
+
+    def _rescan(self, text):
+        """
+        Parse some text with a child lexer so current tokenization isn't
+        interfered with, the lexer being released once done.
+        
+        :param      text:  The text to rescan
+        :type       text:  str
+        """
+        lexer = self._lexer.make_child()
+        try:
+            return self.parse(text, lexer = lexer)
+        finally:
+            self._lexer.release_child(lexer)
+
     def define_macro(self, name, **kwargs):
         """
         Define a new Macro using intermediate representation.
@@ -995,6 +1151,11 @@ class C99PreProcessor(object):
         :param      kwargs:     The keyword arguments
         :type       kwargs:     dict
         """
+        # Any cached expansion could refer to the (re)defined macro.
+        self._expansion_cache.clear()
+
+        name = sys.intern(name)
+
         self.macro[name] = ir.Macro(name, **kwargs) 
         return self.macro[name]
 
@@ -1007,29 +1168,142 @@ class C99PreProcessor(object):
         :param      arg_list:  The argument list
         :type       arg_list:  list
         """
-        if name in self.macro:
-            replacement = None
-            if not self.macro[name].has_been_expanded:
-                replacement = self.macro[name].expand(arg_list)
-                
-                # Rescanning  yield "Reach EOF" because parser expects the input to be compliant as a source file.
-                # So we are appending a newline to the replacement to follow C standard.
-                # NB: replacement needs to be casted to str due to return of int/float from lexer (see if it can be handled better).
-                lexer = self._lexer._lexer.clone()
-                lexer_input = str(replacement) + '\n'
-                
-                # We remove last char which is the extra newline added previously to allow parsing of the replacement as a source file.
-                replacement = self.parse(lexer_input, lexer = lexer)[:-1]
-            else:
-                print(f'Warning: Macro {name} is recursive')
+        # Macro is fetched once, the macro table being looked up for every identifier of the parsed text.
+        macro = self.macro.get(name)
 
-            # Reset expansion flag to False to allow macro expansion in detection of a further token in current parsed text.
-            self.macro[name].has_been_expanded = False
-
-            return replacement
-        else:
+        if macro is None:
             raise NameError(f'Macro {name} not defined.')
 
+        if name in self._hideset:
+            return None
+
+        if macro.callback and name in self._builtin_macros:
+            # Expansion depending on current position can't be memoized.
+            self._is_expansion_volatile = True
+            return self._builtin_macros[name]()
+
+        # Result of a nested expansion depends on macros currently being expanded so only
+        # expansions started from the parsed text are memoized.
+        cache_key    = (name, tuple(arg_list))
+        is_cacheable = not self._hideset
+
+        if is_cacheable:
+            replacement = self._expansion_cache.get(cache_key)
+            if replacement is not None:
+                return replacement
+
+            self._is_expansion_volatile = False
+
+        replacement = macro.expand(arg_list)
+
+        # Callback macros (__LINE__, __FILE__, ...) yield a different replacement on each expansion.
+        if macro.callback:
+            self._is_expansion_volatile = True
+        
+        # Rescanning  yield "Reach EOF" because parser expects the input to be compliant as a source file.
+        # So we are appending a newline to the replacement to follow C standard.
+        # NB: replacement needs to be casted to str due to return of int/float from lexer (see if it can be handled better).
+        lexer_input = str(replacement) + '\n'
+        
+        # Macro is hidden while its replacement is rescanned then restored for further tokens of current parsed text.
+        # We remove last char which is the extra newline added previously to allow parsing of the replacement as a source file.
+        hideset       = self._hideset
+        self._hideset = hideset | {name}
+        try:
+            replacement = self._rescan(lexer_input)[:-1]
+        finally:
+            self._hideset = hideset
+
+        if is_cacheable and replacement != None and not self._is_expansion_volatile:
+            self._expansion_cache[cache_key] = replacement
+
+        return replacement
+
+    def _evaluate_condition(self, token_list):
+        """
+        Evaluate the condition of an #if/#elif directive.
+        
+        :param      token_list:  The constant expression token values
+        :type       token_list:  list
+        """
+        return C99ConstantExpression(self._expand_constant_expression(token_list)).evaluate()
+
+    def _expand_constant_expression(self, token_list):
+        """
+        Replace defined operators and macros of a constant expression
+        by their values.
+        
+        :param      token_list:  The constant expression token values
+        :type       token_list:  list
+        """
+        expanded_token_list = []
+        position            = 0
+
+        while position < len(token_list):
+            token     = token_list[position]
+            position += 1
+
+            if token == 'defined':
+                if position < len(token_list) and token_list[position] == '(':
+                    identifier = token_list[position + 1]
+                    if token_list[position + 2 : position + 3] != [')']:
+                        raise Exception("Missing ')' after defined operator.")
+                    position += 3
+                else:
+                    identifier = token_list[position]
+                    position  += 1
+
+                expanded_token_list.append(int(identifier in self.macro))
+            elif token in self.macro:
+                macro    = self.macro[token]
+                arg_list = []
+
+                # Collect arguments of a function-like macro, an argument being
+                # any token sequence up to a comma outside of parenthesis.
+                if not macro.callback and (macro.arg_list or macro.variadic) and \
+                   position < len(token_list) and token_list[position] == '(':
+                    depth     = 0
+                    argument  = []
+                    position += 1
+
+                    while position < len(token_list):
+                        arg_token = token_list[position]
+                        position += 1
+
+                        if arg_token == ')' and not depth:
+                            break
+                        elif arg_token == ',' and not depth:
+                            arg_list.append(' '.join([str(t) for t in argument]))
+                            argument = []
+                            continue
+                        elif arg_token == '(':
+                            depth += 1
+                        elif arg_token == ')':
+                            depth -= 1
+
+                        argument.append(arg_token)
+
+                    if argument or arg_list:
+                        arg_list.append(' '.join([str(t) for t in argument]))
+
+                replacement = self.expand_macro(token, arg_list)
+
+                if replacement == None:
+                    expanded_token_list.append(token)
+                else:
+                    # Replacement has been fully expanded so it only needs to be split back into token values.
+                    lexer = self._lexer.make_child()
+                    try:
+                        lexer.begin("INITIAL")
+                        lexer.input(str(replacement))
+                        expanded_token_list.extend([tok.value for tok in iter(lexer.token, None) if tok.type != "NEWLINE"])
+                    finally:
+                        self._lexer.release_child(lexer)
+            else:
+                expanded_token_list.append(token)
+
+        return expanded_token_list
+
     def undef_macro(self, name):
         """
         Undefine a macro.
@@ -1037,6 +1311,8 @@ class C99PreProcessor(object):
         :param      name:  The name
         :type       name:  str
         """
+        self._expansion_cache.clear()
+
         return self.macro.pop(name, None)
 
     def include(self, header_name):
@@ -1046,39 +1322,125 @@ class C99PreProcessor(object):
         :param      header_name:  The header name
         :type       header_name:  str
         """
-        include_content  = ''
-        is_include_found = False
-        header_path      = header_name[1:-1]
+        header_path = header_name[1:-1]
+        is_quoted   = header_name[0] == '"' and header_name[-1] == '"'
 
-        if header_path in self.headers_table:
-            return self.headers_table[header_path]
+        # Quoted header names are first searched relatively to the current file so its directory
+        # is part of the key.
+        lookup_key = (self._current_file.parent, header_path) if is_quoted else header_path
 
-        if header_name[0] == '"' and header_name[-1] == '"':
-            include_path = self._current_file.parent.joinpath(header_path)
-            is_include_found = include_path.is_file()
+        # Failed lookups are cached too (as None) so a missing header doesn't hit the filesystem again.
+        include_paths = self._include_paths.get(lookup_key, False)
 
-        # If include hasn't been found in relative path or header name is enclosed by <> then looks inside
-        # stdlib path.
-        if not is_include_found:
-            for std_dir in self._stdlib_path:
-                include_path = Path(std_dir).joinpath(header_path)
-                is_include_found = include_path.is_file()
-                if is_include_found:
-                    break
-        
-        if not is_include_found:
+        if include_paths is False:
+            include_path  = self._resolve_include(header_path, is_quoted)
+            include_paths = (include_path, include_path.resolve()) if include_path else None
+            self._include_paths[lookup_key] = include_paths
+
+        if include_paths is None:
             # Neither stdlib/relative path yield an existing file so we have to raise an error.
             raise FileNotFoundError(f'{header_path} doesn\'t resolve to an existing file.')
-        else:
-            include_content = f'{self.process(include_path, self._lexer._lexer.clone())}\n'
+
+        # Resolved path only identifies the header, it is processed from the path it has been found at
+        # so __FILE__ and its own quoted includes follow that path (e.g. through a symbolic link).
+        include_path, header_key = include_paths
+
+        # A guarded header whose guard macro is defined would expand to nothing, so there's
+        # no need to look at its content again.
+        header_guard = self._header_guards.get(header_key)
+
+        if header_guard and header_guard in self.macro:
+            return ''
+
+        include_content = self.headers_table.get(header_key)
+
+        if include_content is not None:
+            return include_content
+
+        # Headers are processed in place and one at a time: their output depends on macros defined
+        # before the include and they may define macros used by the rest of the current file.
+        # Parallelism is only applied between translation units (see preprocess_many).
+        lexer = self._lexer.make_child()
+        try:
+            include_content = f'{self.process(include_path, lexer, header_key)}\n'
+        finally:
+            self._lexer.release_child(lexer)
 
         # Add the preprocessed include inside the headers table so we can later output
         # contents inside intermediate files *.i or avoid reprocessing an already preprocessed
         # header.
-        self.headers_table[header_path] = include_content
+        self.headers_table[header_key] = include_content
 
         return include_content
 
+    def _resolve_include(self, header_path, is_quoted):
+        """
+        Resolve the path of an included header.
+        
+        :param      header_path:  The header path, without its delimiters
+        :type       header_path:  str
+        :param      is_quoted:    Whether header name is enclosed by quotes
+        :type       is_quoted:    bool
+
+        :returns:   The header path or None if no file has been found
+        :rtype:     Path
+        """
+        if is_quoted:
+            include_path = self._current_file.parent.joinpath(header_path)
+            if self._is_header_file(include_path):
+                return include_path
+
+        # If include hasn't been found in relative path or header name is enclosed by <> then looks inside
+        # stdlib path.
+        for std_dir in self._stdlib_path:
+            include_path = std_dir / header_path
+            if self._is_header_file(include_path):
+                return include_path
+
+        return None
+
+    def _is_header_file(self, include_path):
+        """
+        Check whether a header path names an existing file, using the listing of
+        its directory.
+        
+        :param      include_path:  The header path
+        :type       include_path:  Path
+        """
+        file_names, folded_file_names = self._list_dir(include_path.parent)
+
+        if include_path.name in file_names:
+            return True
+
+        # Names only differing by case are left to the filesystem, which matches them on
+        # case-insensitive filesystems (macOS, Windows).
+        return include_path.name.casefold() in folded_file_names and include_path.is_file()
+
+    def _list_dir(self, directory):
+        """
+        List the files of a directory, the listing being read once then reused
+        by any header searched in that directory.
+        
+        :param      directory:  The directory
+        :type       directory:  Path
+
+        :returns:   The file names and their casefolded version, empty if directory doesn't exist
+        :rtype:     tuple
+        """
+        listing = self._dir_index.get(directory)
+
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    file_names = {entry.name for entry in entries if entry.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                file_names = set()
+
+            listing = (file_names, {file_name.casefold() for file_name in file_names})
+            self._dir_index[directory] = listing
+
+        return listing
+
     def pragma(self, directive):
         """
         Execute the pragma directive
@@ -1099,7 +1461,7 @@ class C99PreProcessor(object):
             self._lexer._lexer.lineno = int(directive[0])
         else:
             self._lexer._lexer.lineno = int(directive[0])
-            self._current_file        = Path(directive[1].replace('"', ''), encoding = 'utf-8')
+            self._current_file        = Path(directive[1].replace('"', ''))
         
         return '\n'
 
@@ -1110,10 +1472,10 @@ class C99PreProcessor(object):
         :param      file_content:    The header/source file content
         :type       file_content:    str
         """
-        for di_trigraph, replacing_char in self._di_tri_graph_replace_table.items():
-            file_content = file_content.replace(di_trigraph, replacing_char)
+        if not any(char in file_content for char in self._di_tri_graph_chars):
+            return file_content
 
-        return file_content
+        return self._di_tri_graph_re.sub(lambda match: self._di_tri_graph_replace_table[match.group()], file_content)
 
     def _join_backslash(self, file_content):
         """
@@ -1131,36 +1493,63 @@ class C99PreProcessor(object):
         :param      file_content:  The header/source file content
         :type       file_content:  str
         """
-        return re.sub(COMMENT_RE, ' ', file_content)
+        return self._comment_re.sub(' ', file_content)
 
-    def _is_source_file(self, file_content):
+    def _find_header_guard(self, file_content):
         """
-        Determines whether the specified file content is source file.
+        Find the guard macro of a header, the header being guarded if the whole
+        content is wrapped inside an #ifndef X/#define X ... #endif section
+        without any #elif/#else branch.
         
-        :param      file_content:  The file content
+        :param      file_content:  The header/source file content
         :type       file_content:  str
         """
-        return len(file_content) and file_content[-1] == '\n'
+        header_guard = self._header_guard_re.match(file_content)
+
+        if not header_guard:
+            return None
 
-    def process(self, file_path, lexer = None):
+        depth = 0
+
+        for directive in self._conditional_re.finditer(file_content):
+            if directive.group(1) == 'endif':
+                depth -= 1
+            elif directive.group(1) in ('elif', 'else'):
+                if depth == 1:
+                    return None
+            else:
+                depth += 1
+
+            if not depth:
+                # Guard if section must end the header.
+                return header_guard.group(1) if not file_content[directive.end():].strip() else None
+
+        return None
+
+    def _translate(self, file):
         """
-        Preprocess a source file before compiling it to Python code.
+        Read a file and apply translation phases 1 to 3 on its content.
         
-        The pre processing is responsible of directive execution which
-        starts with '#'.
-
-        :param      file_path:  The file path
-        :type       file_path:  str
+        :param      file:  The file path
+        :type       file:  Path
         """
-        file = Path(file_path, encoding = 'utf-8')
+        # Content is decoded straight from the mapped file, no intermediate bytes copy being made.
+        # Empty files can't be mapped.
+        with open(file, 'rb') as source_file:
+            if os.fstat(source_file.fileno()).st_size:
+                with mmap.mmap(source_file.fileno(), 0, access = mmap.ACCESS_READ) as mapped_file:
+                    file_content = str(mapped_file, 'utf-8')
+            else:
+                file_content = ''
 
-        # Store temporarily current file in case of include
-        current_file_tmp = self._current_file 
-        self._current_file = file
+        # Line endings are translated as text mode would do, the lookup being a plain memchr.
+        if '\r' in file_content:
+            file_content = file_content.replace('\r\n', '\n').replace('\r', '\n')
 
-        file_content = file.read_text()
-        
-        if not self._is_source_file(file_content):
+        # The file content being only referenced by file_content the missing newline is appended
+        # in place by CPython.
+        # A source file shall end with a newline (C99 5.1.1.2), slicing handles empty files too.
+        if file_content[-1:] != '\n':
             file_content += '\n'
 
         # Translation phase 1
@@ -1172,6 +1561,68 @@ class C99PreProcessor(object):
         # Translation phase 3 and 4 are done in parallel
         if not self._keep_comment:
             file_content = self._strip_comment(file_content)
+
+        return file_content
+
+    def _translate_header(self, file):
+        """
+        Translate an included header, reusing the result of a previous translation
+        as long as the file isn't modified.
+        
+        :param      file:  The resolved header path
+        :type       file:  Path
+
+        :returns:   The translated content and its guard macro
+        :rtype:     tuple
+        """
+        # Translation depends on overridable attributes of the preprocessor so its class is part of the key,
+        # header path is already resolved by include.
+        file_stat     = file.stat()
+        file_version  = (file_stat.st_mtime_ns, file_stat.st_size)
+        cache_key     = (type(self), file, self._keep_comment)
+        cached_header = _translated_headers.get(cache_key)
+
+        if cached_header and cached_header[0] == file_version:
+            _translated_headers.move_to_end(cache_key)
+            return cached_header[1:]
+
+        file_content = self._translate(file)
+        header_guard = self._find_header_guard(file_content)
+
+        _translated_headers[cache_key] = (file_version, file_content, header_guard)
+        _translated_headers.move_to_end(cache_key)
+
+        if len(_translated_headers) > TRANSLATED_HEADERS_MAX:
+            _translated_headers.popitem(last = False)
+
+        return file_content, header_guard
+
+    def process(self, file_path, lexer = None, header_key = None):
+        """
+        Preprocess a source file before compiling it to Python code.
+        
+        The pre processing is responsible of directive execution which
+        starts with '#'.
+
+        :param      file_path:   The file path
+        :type       file_path:   str
+        :param      lexer:       The lexer used for an included header
+        :type       lexer:       Lexer
+        :param      header_key:  The resolved path of an included header
+        :type       header_key:  Path
+        """
+        file = Path(file_path)
+
+        # Store temporarily current file in case of include
+        current_file_tmp = self._current_file 
+        self._current_file = file
+
+        # Only included headers are worth sharing between translation units.
+        if header_key:
+            file_content, header_guard = self._translate_header(header_key)
+            self._header_guards[header_key] = header_guard
+        else:
+            file_content = self._translate(file)
         
         if not lexer:
             lexer = self._lexer._lexer
@@ -1182,6 +1633,48 @@ class C99PreProcessor(object):
 
         return preprocessed_output
 
+    @classmethod
+    def preprocess_many(cls, file_paths, max_workers = None, **kwargs):
+        """
+        Preprocess independent translation units in parallel, each one with its own
+        preprocessor so no macro is shared between them.
+
+        :param      file_paths:   The source file paths
+        :type       file_paths:   list
+        :param      max_workers:  The maximum number of worker processes
+        :type       max_workers:  int
+        :param      kwargs:       The keyword arguments given to each preprocessor
+        :type       kwargs:       dict
+
+        :returns:   The preprocessed outputs, in the same order as file paths
+        :rtype:     list
+        """
+        with ProcessPoolExecutor(max_workers = max_workers, initializer = _init_worker,
+                                 initargs = (cls, kwargs)) as executor:
+            return list(executor.map(_preprocess_file, file_paths))
+
+# Preprocessor class and its arguments used by the current worker process of preprocess_many.
+_worker_class  = None
+_worker_kwargs = None
+
+def _init_worker(preprocessor_class, kwargs):
+    """
+    Set up a worker process of preprocess_many, a first preprocessor being built so
+    PLY tables are imported once per worker instead of once per file.
+    """
+    global _worker_class, _worker_kwargs
+
+    _worker_class  = preprocessor_class
+    _worker_kwargs = kwargs
+
+    preprocessor_class(**kwargs)
+
+def _preprocess_file(file_path):
+    """
+    Preprocess a translation unit in a worker process of preprocess_many.
+    """
+    return _worker_class(**_worker_kwargs).process(file_path)
+
 if __name__ == "__main__":
     pre_processor = C99PreProcessor(debug = False, keep_comment = False)
 
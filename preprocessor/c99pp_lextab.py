@@ -0,0 +1,10 @@
+# c99pp_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADD_ASSIGN', 'AND_ASSIGN', 'AND_OP', 'CONSTANT', 'DEC_OP', 'DEFINE', 'DEFINED', 'DIRECTIVE', 'DIV_ASSIGN', 'ELIF', 'ELLIPSIS', 'ELSE', 'ENDIF', 'EQ_OP', 'ERROR', 'GE_OP', 'HASH_HASH', 'HEADER_NAME', 'IDENTIFIER', 'IF', 'IFDEF', 'IFNDEF', 'INCLUDE', 'INC_OP', 'LEFT_ASSIGN', 'LEFT_OP', 'LE_OP', 'LINE', 'LPAREN', 'MOD_ASSIGN', 'MUL_ASSIGN', 'NEWLINE', 'NE_OP', 'OR_ASSIGN', 'OR_OP', 'PRAGMA', 'PTR_OP', 'RIGHT_ASSIGN', 'RIGHT_OP', 'STRING_LITERAL', 'SUB_ASSIGN', 'UNDEF', 'XOR_ASSIGN', '_PRAGMA'))
+_lexreflags   = 32
+_lexliterals  = ';{},:=()[].&!~-+*/%<>^|?"@#'
+_lexstateinfo = {'INITIAL': 'inclusive', 'directive': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NEWLINE>\\n+)|(?P<t_HEADER_NAME><[^<>]+>|"[^"]+" )|(?P<t_DIRECTIVE>\\#[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_STRING_LITERAL>L?"(\\\\.|[^\\\\\\"])*")|(?P<t_CONSTANT>(?P<hex_constant>0[xX][a-fA-F0-9]+)(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?|(?P<float_constant>[0-9]+[Ee][+-]?[0-9]+|[0-9]*\\.[0-9]+(?:[Ee][+-]?[0-9]+)?|[0-9]+\\.[0-9]*(?:[Ee][+-]?[0-9]+)?)[fFlL]?|(?P<oct_constant>0[0-7]+)(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?|(?P<int_constant>[0-9]+)(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?)|(?P<t_LITERAL>L?\\\'(\\\\.|[^\\\'])+\\\')|(?P<t_LPAREN>\\()|(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_DEC_OP>\\-\\-)|(?P<t_HASH_HASH>\\#\\#)|(?P<t_INC_OP>\\+\\+)|(?P<t_OR_OP>\\|\\|)|(?P<t_ADD_ASSIGN>\\+=)|(?P<t_LEFT_ASSIGN><<=)|(?P<t_MUL_ASSIGN>\\*=)|(?P<t_OR_ASSIGN>\\|=)|(?P<t_PTR_OP>\\->)|(?P<t_RIGHT_ASSIGN>>>=)|(?P<t_XOR_ASSIGN>\\^=)|(?P<t_AND_ASSIGN>&=)|(?P<t_AND_OP>&&)|(?P<t_DIV_ASSIGN>/=)|(?P<t_EQ_OP>==)|(?P<t_GE_OP>>=)|(?P<t_LEFT_OP><<)|(?P<t_LE_OP><=)|(?P<t_MOD_ASSIGN>%=)|(?P<t_NE_OP>!=)|(?P<t_RIGHT_OP>>>)|(?P<t_SUB_ASSIGN>-=)', [None, ('t_NEWLINE', 'NEWLINE'), ('t_HEADER_NAME', 'HEADER_NAME'), ('t_DIRECTIVE', 'DIRECTIVE'), ('t_IDENTIFIER', 'IDENTIFIER'), ('t_STRING_LITERAL', 'STRING_LITERAL'), None, ('t_CONSTANT', 'CONSTANT'), None, None, None, None, ('t_LITERAL', 'LITERAL'), None, ('t_LPAREN', 'LPAREN'), (None, 'ELLIPSIS'), (None, 'DEC_OP'), (None, 'HASH_HASH'), (None, 'INC_OP'), (None, 'OR_OP'), (None, 'ADD_ASSIGN'), (None, 'LEFT_ASSIGN'), (None, 'MUL_ASSIGN'), (None, 'OR_ASSIGN'), (None, 'PTR_OP'), (None, 'RIGHT_ASSIGN'), (None, 'XOR_ASSIGN'), (None, 'AND_ASSIGN'), (None, 'AND_OP'), (None, 'DIV_ASSIGN'), (None, 'EQ_OP'), (None, 'GE_OP'), (None, 'LEFT_OP'), (None, 'LE_OP'), (None, 'MOD_ASSIGN'), (None, 'NE_OP'), (None, 'RIGHT_OP'), (None, 'SUB_ASSIGN')])], 'directive': [('(?P<t_directive_LPAREN>(?<!\\s)\\()|(?P<t_directive_RPAREN>\\))', [None, ('t_directive_LPAREN', 'LPAREN'), ('t_directive_RPAREN', 'RPAREN')]), ('(?P<t_NEWLINE>\\n+)|(?P<t_HEADER_NAME><[^<>]+>|"[^"]+" )|(?P<t_DIRECTIVE>\\#[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_STRING_LITERAL>L?"(\\\\.|[^\\\\\\"])*")|(?P<t_CONSTANT>(?P<hex_constant>0[xX][a-fA-F0-9]+)(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?|(?P<float_constant>[0-9]+[Ee][+-]?[0-9]+|[0-9]*\\.[0-9]+(?:[Ee][+-]?[0-9]+)?|[0-9]+\\.[0-9]*(?:[Ee][+-]?[0-9]+)?)[fFlL]?|(?P<oct_constant>0[0-7]+)(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?|(?P<int_constant>[0-9]+)(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?)|(?P<t_LITERAL>L?\\\'(\\\\.|[^\\\'])+\\\')|(?P<t_LPAREN>\\()|(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_DEC_OP>\\-\\-)|(?P<t_HASH_HASH>\\#\\#)|(?P<t_INC_OP>\\+\\+)|(?P<t_OR_OP>\\|\\|)|(?P<t_ADD_ASSIGN>\\+=)|(?P<t_LEFT_ASSIGN><<=)|(?P<t_MUL_ASSIGN>\\*=)|(?P<t_OR_ASSIGN>\\|=)|(?P<t_PTR_OP>\\->)|(?P<t_RIGHT_ASSIGN>>>=)|(?P<t_XOR_ASSIGN>\\^=)|(?P<t_AND_ASSIGN>&=)|(?P<t_AND_OP>&&)|(?P<t_DIV_ASSIGN>/=)|(?P<t_EQ_OP>==)|(?P<t_GE_OP>>=)|(?P<t_LEFT_OP><<)|(?P<t_LE_OP><=)|(?P<t_MOD_ASSIGN>%=)|(?P<t_NE_OP>!=)|(?P<t_RIGHT_OP>>>)|(?P<t_SUB_ASSIGN>-=)', [None, ('t_NEWLINE', 'NEWLINE'), ('t_HEADER_NAME', 'HEADER_NAME'), ('t_DIRECTIVE', 'DIRECTIVE'), ('t_IDENTIFIER', 'IDENTIFIER'), ('t_STRING_LITERAL', 'STRING_LITERAL'), None, ('t_CONSTANT', 'CONSTANT'), None, None, None, None, ('t_LITERAL', 'LITERAL'), None, ('t_LPAREN', 'LPAREN'), (None, 'ELLIPSIS'), (None, 'DEC_OP'), (None, 'HASH_HASH'), (None, 'INC_OP'), (None, 'OR_OP'), (None, 'ADD_ASSIGN'), (None, 'LEFT_ASSIGN'), (None, 'MUL_ASSIGN'), (None, 'OR_ASSIGN'), (None, 'PTR_OP'), (None, 'RIGHT_ASSIGN'), (None, 'XOR_ASSIGN'), (None, 'AND_ASSIGN'), (None, 'AND_OP'), (None, 'DIV_ASSIGN'), (None, 'EQ_OP'), (None, 'GE_OP'), (None, 'LEFT_OP'), (None, 'LE_OP'), (None, 'MOD_ASSIGN'), (None, 'NE_OP'), (None, 'RIGHT_OP'), (None, 'SUB_ASSIGN')])]}
+_lexstateignore = {'directive': ' \t', 'INITIAL': ' \t'}
+_lexstateerrorf = {'directive': 't_directive_error', 'INITIAL': 't_error'}
+_lexstateeoff = {}
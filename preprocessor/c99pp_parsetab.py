@@ -0,0 +1,149 @@
+
+# c99pp_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'preprocessing_fileADD_ASSIGN AND_ASSIGN AND_OP CONSTANT DEC_OP DEFINE DEFINED DIRECTIVE DIV_ASSIGN ELIF ELLIPSIS ELSE ENDIF EQ_OP ERROR GE_OP HASH_HASH HEADER_NAME IDENTIFIER IF IFDEF IFNDEF INCLUDE INC_OP LEFT_ASSIGN LEFT_OP LE_OP LINE LPAREN MOD_ASSIGN MUL_ASSIGN NEWLINE NE_OP OR_ASSIGN OR_OP PRAGMA PTR_OP RIGHT_ASSIGN RIGHT_OP STRING_LITERAL SUB_ASSIGN UNDEF XOR_ASSIGN _PRAGMA\n        preprocessing_file : \n                           | group\n        \n        group : group_part\n        \n        group : group group_part\n        \n        group_part : control_line\n                   | if_section\n                   | text_line\n                   | conditionally_supported_directive\n        \n        control_line : define_directive NEWLINE\n                     | error_directive NEWLINE\n                     | include_directive NEWLINE\n                     | line_directive NEWLINE\n                     | pragma_directive NEWLINE\n                     | undef_directive NEWLINE\n        \n        if_section  : if_group endif_line\n        \n        if_section  : if_group elif_groups endif_line\n        \n        if_section  : if_group else_group endif_line\n        \n        if_section  : if_group elif_groups else_group endif_line\n        \n        if_group : IF constant_expression NEWLINE\n                 | IF constant_expression NEWLINE group\n        \n        if_group : IFDEF IDENTIFIER NEWLINE\n                 | IFDEF IDENTIFIER NEWLINE group\n        \n        if_group : IFNDEF IDENTIFIER NEWLINE\n                 | IFNDEF IDENTIFIER NEWLINE group\n        \n        elif_groups : elif_group\n        \n        elif_groups : elif_groups elif_group\n        \n        elif_group : ELIF elif_expression NEWLINE\n                   | ELIF elif_expression NEWLINE group\n        \n        else_group : ELSE NEWLINE\n                   | ELSE NEWLINE group\n        \n        endif_line : ENDIF NEWLINE\n        \n        define_directive : DEFINE IDENTIFIER replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN \')\' replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN identifier_list \')\' replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN ELLIPSIS \')\' replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN identifier_list \',\' ELLIPSIS \')\' replacement_list\n        \n        error_directive : ERROR\n                        | ERROR token_list\n        \n        include_directive : INCLUDE token_list\n        \n        line_directive : LINE token_list\n        \n        pragma_directive : PRAGMA\n                         | PRAGMA token_list\n                         | _PRAGMA \'(\' STRING_LITERAL \')\'\n        \n        undef_directive : UNDEF IDENTIFIER\n        \n        constant_expression : if_token_list\n        \n        elif_expression : if_token_list\n        \n        if_token_list : if_token\n        \n        if_token_list : if_token_list if_token\n        \n        if_token : IDENTIFIER\n                 | DEFINED\n                 | CONSTANT\n                 | STRING_LITERAL\n                 | HEADER_NAME\n                 | LPAREN\n                 | operator_punc\n        \n        text_line : NEWLINE\n                  | token_list NEWLINE\n        \n        conditionally_supported_directive : DIRECTIVE token_list NEWLINE\n        \n        identifier_list : IDENTIFIER\n        \n        identifier_list : identifier_list \',\' IDENTIFIER\n        \n        replacement_list : \n                         | token_list\n        \n        token_list : token\n        \n        token_list : token_list token\n        \n        token :     IDENTIFIER\n        \n        token :     HEADER_NAME\n                |   CONSTANT\n                |   STRING_LITERAL\n                |   operator_punc\n        operator_punc :     \'=\'\n                               | AND_OP\n                               | MUL_ASSIGN \n                               | DIV_ASSIGN\n                               | MOD_ASSIGN \n                               | ADD_ASSIGN \n                               | SUB_ASSIGN \n                               | LEFT_ASSIGN \n                               | RIGHT_ASSIGN \n                               | AND_ASSIGN \n                               | XOR_ASSIGN \n                               | OR_ASSIGN \n                               | DEC_OP\n                               | ELLIPSIS\n                               | EQ_OP\n                               | GE_OP\n                               | INC_OP\n                               | LEFT_OP\n                               | LE_OP\n                               | NE_OP\n                               | HASH_HASH\n                               | PTR_OP\n                               | OR_OP\n                               | RIGHT_OP\n                               | \';\'\n                               | \'{\'\n                               | \'}\'\n                               | \',\' \n                               | \':\'\n                               | \'(\'\n                               | \')\'\n                               | \'[\'\n                               | \']\'\n                               | \'.\'\n                               | \'&\'\n                               | \'!\'\n                               | \'~\'\n                               | \'-\'\n                               | \'+\'\n                               | \'*\'\n                               | \'/\'\n                               | \'%\'\n                               | \'<\'\n                               | \'>\'\n                               | \'^\'\n                               | \'|\'\n                               | \'?\'\n                               | \'"\'\n                               | \'@\'\n                               | \'#\'\n                               '
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,128,137,],[-1,0,-2,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,-58,-18,]),'NEWLINE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,16,19,20,21,22,23,26,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,96,98,99,100,101,102,103,104,105,107,108,109,110,111,112,113,114,115,116,117,118,119,120,123,124,125,126,127,128,129,131,133,134,135,136,137,138,139,141,144,145,146,147,148,149,150,152,153,156,157,158,],[9,9,-3,-5,-6,-7,-8,85,-56,86,87,88,89,90,98,-65,-100,-83,-97,-37,-41,-99,-68,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,124,125,-57,-64,128,-61,-38,-39,-40,-42,-44,133,-45,-47,-49,-50,-51,-52,-53,-54,-55,135,136,-16,-17,-31,9,139,-46,-58,-32,-62,9,-48,9,9,-18,9,9,-61,-43,9,9,9,9,-33,-61,-61,-34,-35,-61,-36,]),'DIRECTIVE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[17,17,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,17,-58,17,17,17,-18,17,17,17,17,17,17,]),'DEFINE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[18,18,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,18,-58,18,18,18,-18,18,18,18,18,18,18,]),'ERROR':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[23,23,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,23,-58,23,23,23,-18,23,23,23,23,23,23,]),'INCLUDE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[24,24,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,24,-58,24,24,24,-18,24,24,24,24,24,24,]),'LINE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[25,25,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,25,-58,25,25,25,-18,25,25,25,25,25,25,]),'PRAGMA':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[26,26,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,26,-58,26,26,26,-18,26,26,26,26,26,26,]),'_PRAGMA':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[27,27,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,27,-58,27,27,27,-18,27,27,27,27,27,27,]),'UNDEF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[30,30,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,30,-58,30,30,30,-18,30,30,30,30,30,30,]),'IF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[31,31,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,31,-58,31,31,31,-18,31,31,31,31,31,31,]),'IFDEF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[32,32,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,32,-58,32,32,32,-18,32,32,32,32,32,32,]),'IFNDEF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,120,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[33,33,-3,-5,-6,-7,-8,-56,-4,-9,-10,-11,-12,-13,-14,-15,-57,-16,-17,-31,33,-58,33,33,33,-18,33,33,33,33,33,33,]),'IDENTIFIER':([0,2,3,4,5,6,7,9,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,130,131,133,134,135,136,137,138,139,141,145,146,147,148,150,151,152,157,],[19,19,-3,-5,-6,-7,-8,-56,19,19,101,-65,-100,-83,-97,19,19,19,19,-99,-68,107,111,118,119,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,111,-57,-64,19,19,19,19,19,19,111,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,19,111,-58,140,19,19,-48,19,19,-18,19,19,19,19,19,19,19,19,154,19,19,]),'HEADER_NAME':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[35,35,-3,-5,-6,-7,-8,-56,35,35,-65,-100,-83,-97,35,35,35,35,-99,-68,115,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,115,-57,-64,35,35,35,35,35,35,115,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,35,115,-58,35,35,-48,35,35,-18,35,35,35,35,35,35,35,35,35,35,]),'CONSTANT':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[36,36,-3,-5,-6,-7,-8,-56,36,36,-65,-100,-83,-97,36,36,36,36,-99,-68,113,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,113,-57,-64,36,36,36,36,36,36,113,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,36,113,-58,36,36,-48,36,36,-18,36,36,36,36,36,36,36,36,36,36,]),'STRING_LITERAL':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,106,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[29,29,-3,-5,-6,-7,-8,-56,29,29,-65,-100,-83,-97,29,29,29,29,-99,-68,114,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,114,-57,-64,29,29,29,29,29,29,132,114,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,29,114,-58,29,29,-48,29,29,-18,29,29,29,29,29,29,29,29,29,29,]),'=':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[38,38,-3,-5,-6,-7,-8,-56,38,38,-65,-100,-83,-97,38,38,38,38,-99,-68,38,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,38,-57,-64,38,38,38,38,38,38,38,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,38,38,-58,38,38,-48,38,38,-18,38,38,38,38,38,38,38,38,38,38,]),'AND_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[39,39,-3,-5,-6,-7,-8,-56,39,39,-65,-100,-83,-97,39,39,39,39,-99,-68,39,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,39,-57,-64,39,39,39,39,39,39,39,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,39,39,-58,39,39,-48,39,39,-18,39,39,39,39,39,39,39,39,39,39,]),'MUL_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[40,40,-3,-5,-6,-7,-8,-56,40,40,-65,-100,-83,-97,40,40,40,40,-99,-68,40,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,40,-57,-64,40,40,40,40,40,40,40,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,40,40,-58,40,40,-48,40,40,-18,40,40,40,40,40,40,40,40,40,40,]),'DIV_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[41,41,-3,-5,-6,-7,-8,-56,41,41,-65,-100,-83,-97,41,41,41,41,-99,-68,41,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,41,-57,-64,41,41,41,41,41,41,41,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,41,41,-58,41,41,-48,41,41,-18,41,41,41,41,41,41,41,41,41,41,]),'MOD_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[42,42,-3,-5,-6,-7,-8,-56,42,42,-65,-100,-83,-97,42,42,42,42,-99,-68,42,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,42,-57,-64,42,42,42,42,42,42,42,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,42,42,-58,42,42,-48,42,42,-18,42,42,42,42,42,42,42,42,42,42,]),'ADD_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[43,43,-3,-5,-6,-7,-8,-56,43,43,-65,-100,-83,-97,43,43,43,43,-99,-68,43,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,43,-57,-64,43,43,43,43,43,43,43,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,43,43,-58,43,43,-48,43,43,-18,43,43,43,43,43,43,43,43,43,43,]),'SUB_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[44,44,-3,-5,-6,-7,-8,-56,44,44,-65,-100,-83,-97,44,44,44,44,-99,-68,44,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,44,-57,-64,44,44,44,44,44,44,44,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,44,44,-58,44,44,-48,44,44,-18,44,44,44,44,44,44,44,44,44,44,]),'LEFT_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[45,45,-3,-5,-6,-7,-8,-56,45,45,-65,-100,-83,-97,45,45,45,45,-99,-68,45,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,45,-57,-64,45,45,45,45,45,45,45,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,45,45,-58,45,45,-48,45,45,-18,45,45,45,45,45,45,45,45,45,45,]),'RIGHT_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[46,46,-3,-5,-6,-7,-8,-56,46,46,-65,-100,-83,-97,46,46,46,46,-99,-68,46,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,46,-57,-64,46,46,46,46,46,46,46,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,46,46,-58,46,46,-48,46,46,-18,46,46,46,46,46,46,46,46,46,46,]),'AND_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[47,47,-3,-5,-6,-7,-8,-56,47,47,-65,-100,-83,-97,47,47,47,47,-99,-68,47,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,47,-57,-64,47,47,47,47,47,47,47,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,47,47,-58,47,47,-48,47,47,-18,47,47,47,47,47,47,47,47,47,47,]),'XOR_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[48,48,-3,-5,-6,-7,-8,-56,48,48,-65,-100,-83,-97,48,48,48,48,-99,-68,48,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,48,-57,-64,48,48,48,48,48,48,48,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,48,48,-58,48,48,-48,48,48,-18,48,48,48,48,48,48,48,48,48,48,]),'OR_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[49,49,-3,-5,-6,-7,-8,-56,49,49,-65,-100,-83,-97,49,49,49,49,-99,-68,49,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,49,-57,-64,49,49,49,49,49,49,49,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,49,49,-58,49,49,-48,49,49,-18,49,49,49,49,49,49,49,49,49,49,]),'DEC_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[50,50,-3,-5,-6,-7,-8,-56,50,50,-65,-100,-83,-97,50,50,50,50,-99,-68,50,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,50,-57,-64,50,50,50,50,50,50,50,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,50,50,-58,50,50,-48,50,50,-18,50,50,50,50,50,50,50,50,50,50,]),'ELLIPSIS':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,130,131,133,134,135,136,137,138,139,141,145,146,147,148,150,151,152,157,],[21,21,-3,-5,-6,-7,-8,-56,21,21,-65,-100,-83,-97,21,21,21,21,-99,-68,21,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,21,-57,-64,21,21,21,21,21,21,21,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,21,21,-58,143,21,21,-48,21,21,-18,21,21,21,21,21,21,21,21,155,21,21,]),'EQ_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[51,51,-3,-5,-6,-7,-8,-56,51,51,-65,-100,-83,-97,51,51,51,51,-99,-68,51,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,51,-57,-64,51,51,51,51,51,51,51,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,51,51,-58,51,51,-48,51,51,-18,51,51,51,51,51,51,51,51,51,51,]),'GE_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[52,52,-3,-5,-6,-7,-8,-56,52,52,-65,-100,-83,-97,52,52,52,52,-99,-68,52,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,52,-57,-64,52,52,52,52,52,52,52,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,52,52,-58,52,52,-48,52,52,-18,52,52,52,52,52,52,52,52,52,52,]),'INC_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[53,53,-3,-5,-6,-7,-8,-56,53,53,-65,-100,-83,-97,53,53,53,53,-99,-68,53,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,53,-57,-64,53,53,53,53,53,53,53,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,53,53,-58,53,53,-48,53,53,-18,53,53,53,53,53,53,53,53,53,53,]),'LEFT_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[54,54,-3,-5,-6,-7,-8,-56,54,54,-65,-100,-83,-97,54,54,54,54,-99,-68,54,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,54,-57,-64,54,54,54,54,54,54,54,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,54,54,-58,54,54,-48,54,54,-18,54,54,54,54,54,54,54,54,54,54,]),'LE_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[55,55,-3,-5,-6,-7,-8,-56,55,55,-65,-100,-83,-97,55,55,55,55,-99,-68,55,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,55,-57,-64,55,55,55,55,55,55,55,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,55,55,-58,55,55,-48,55,55,-18,55,55,55,55,55,55,55,55,55,55,]),'NE_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[56,56,-3,-5,-6,-7,-8,-56,56,56,-65,-100,-83,-97,56,56,56,56,-99,-68,56,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,56,-57,-64,56,56,56,56,56,56,56,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,56,56,-58,56,56,-48,56,56,-18,56,56,56,56,56,56,56,56,56,56,]),'HASH_HASH':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[57,57,-3,-5,-6,-7,-8,-56,57,57,-65,-100,-83,-97,57,57,57,57,-99,-68,57,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,57,-57,-64,57,57,57,57,57,57,57,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,57,57,-58,57,57,-48,57,57,-18,57,57,57,57,57,57,57,57,57,57,]),'PTR_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[58,58,-3,-5,-6,-7,-8,-56,58,58,-65,-100,-83,-97,58,58,58,58,-99,-68,58,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,58,-57,-64,58,58,58,58,58,58,58,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,58,58,-58,58,58,-48,58,58,-18,58,58,58,58,58,58,58,58,58,58,]),'OR_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[59,59,-3,-5,-6,-7,-8,-56,59,59,-65,-100,-83,-97,59,59,59,59,-99,-68,59,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,59,-57,-64,59,59,59,59,59,59,59,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,59,59,-58,59,59,-48,59,59,-18,59,59,59,59,59,59,59,59,59,59,]),'RIGHT_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[60,60,-3,-5,-6,-7,-8,-56,60,60,-65,-100,-83,-97,60,60,60,60,-99,-68,60,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,60,-57,-64,60,60,60,60,60,60,60,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,60,60,-58,60,60,-48,60,60,-18,60,60,60,60,60,60,60,60,60,60,]),';':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[61,61,-3,-5,-6,-7,-8,-56,61,61,-65,-100,-83,-97,61,61,61,61,-99,-68,61,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,61,-57,-64,61,61,61,61,61,61,61,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,61,61,-58,61,61,-48,61,61,-18,61,61,61,61,61,61,61,61,61,61,]),'{':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[62,62,-3,-5,-6,-7,-8,-56,62,62,-65,-100,-83,-97,62,62,62,62,-99,-68,62,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,62,-57,-64,62,62,62,62,62,62,62,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,62,62,-58,62,62,-48,62,62,-18,62,62,62,62,62,62,62,62,62,62,]),'}':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[63,63,-3,-5,-6,-7,-8,-56,63,63,-65,-100,-83,-97,63,63,63,63,-99,-68,63,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,63,-57,-64,63,63,63,63,63,63,63,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,63,63,-58,63,63,-48,63,63,-18,63,63,63,63,63,63,63,63,63,63,]),',':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,140,141,142,145,146,147,148,150,152,154,157,],[22,22,-3,-5,-6,-7,-8,-56,22,22,-65,-100,-83,-97,22,22,22,22,-99,-68,22,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,22,-57,-64,22,22,22,22,22,22,22,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,22,22,-58,22,22,-48,22,22,-18,22,22,-59,22,151,22,22,22,22,22,22,-60,22,]),':':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[64,64,-3,-5,-6,-7,-8,-56,64,64,-65,-100,-83,-97,64,64,64,64,-99,-68,64,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,64,-57,-64,64,64,64,64,64,64,64,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,64,64,-58,64,64,-48,64,64,-18,64,64,64,64,64,64,64,64,64,64,]),'(':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,27,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[28,28,-3,-5,-6,-7,-8,-56,28,28,-65,-100,-83,-97,28,28,28,28,106,-99,-68,28,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,28,-57,-64,28,28,28,28,28,28,28,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,28,28,-58,28,28,-48,28,28,-18,28,28,28,28,28,28,28,28,28,28,]),')':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,130,131,132,133,134,135,136,137,138,139,140,141,142,143,145,146,147,148,150,152,154,155,157,],[20,20,-3,-5,-6,-7,-8,-56,20,20,-65,-100,-83,-97,20,20,20,20,-99,-68,20,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,20,-57,-64,20,20,20,20,20,20,20,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,20,20,-58,141,20,144,20,-48,20,20,-18,20,20,-59,20,150,152,20,20,20,20,20,20,-60,157,20,]),'[':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[65,65,-3,-5,-6,-7,-8,-56,65,65,-65,-100,-83,-97,65,65,65,65,-99,-68,65,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,65,-57,-64,65,65,65,65,65,65,65,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,65,65,-58,65,65,-48,65,65,-18,65,65,65,65,65,65,65,65,65,65,]),']':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[66,66,-3,-5,-6,-7,-8,-56,66,66,-65,-100,-83,-97,66,66,66,66,-99,-68,66,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,66,-57,-64,66,66,66,66,66,66,66,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,66,66,-58,66,66,-48,66,66,-18,66,66,66,66,66,66,66,66,66,66,]),'.':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[67,67,-3,-5,-6,-7,-8,-56,67,67,-65,-100,-83,-97,67,67,67,67,-99,-68,67,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,67,-57,-64,67,67,67,67,67,67,67,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,67,67,-58,67,67,-48,67,67,-18,67,67,67,67,67,67,67,67,67,67,]),'&':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[68,68,-3,-5,-6,-7,-8,-56,68,68,-65,-100,-83,-97,68,68,68,68,-99,-68,68,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,68,-57,-64,68,68,68,68,68,68,68,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,68,68,-58,68,68,-48,68,68,-18,68,68,68,68,68,68,68,68,68,68,]),'!':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[69,69,-3,-5,-6,-7,-8,-56,69,69,-65,-100,-83,-97,69,69,69,69,-99,-68,69,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,69,-57,-64,69,69,69,69,69,69,69,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,69,69,-58,69,69,-48,69,69,-18,69,69,69,69,69,69,69,69,69,69,]),'~':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[70,70,-3,-5,-6,-7,-8,-56,70,70,-65,-100,-83,-97,70,70,70,70,-99,-68,70,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,70,-57,-64,70,70,70,70,70,70,70,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,70,70,-58,70,70,-48,70,70,-18,70,70,70,70,70,70,70,70,70,70,]),'-':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[71,71,-3,-5,-6,-7,-8,-56,71,71,-65,-100,-83,-97,71,71,71,71,-99,-68,71,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,71,-57,-64,71,71,71,71,71,71,71,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,71,71,-58,71,71,-48,71,71,-18,71,71,71,71,71,71,71,71,71,71,]),'+':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[72,72,-3,-5,-6,-7,-8,-56,72,72,-65,-100,-83,-97,72,72,72,72,-99,-68,72,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,72,-57,-64,72,72,72,72,72,72,72,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,72,72,-58,72,72,-48,72,72,-18,72,72,72,72,72,72,72,72,72,72,]),'*':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[73,73,-3,-5,-6,-7,-8,-56,73,73,-65,-100,-83,-97,73,73,73,73,-99,-68,73,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,73,-57,-64,73,73,73,73,73,73,73,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,73,73,-58,73,73,-48,73,73,-18,73,73,73,73,73,73,73,73,73,73,]),'/':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[74,74,-3,-5,-6,-7,-8,-56,74,74,-65,-100,-83,-97,74,74,74,74,-99,-68,74,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,74,-57,-64,74,74,74,74,74,74,74,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,74,74,-58,74,74,-48,74,74,-18,74,74,74,74,74,74,74,74,74,74,]),'%':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[75,75,-3,-5,-6,-7,-8,-56,75,75,-65,-100,-83,-97,75,75,75,75,-99,-68,75,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,75,-57,-64,75,75,75,75,75,75,75,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,75,75,-58,75,75,-48,75,75,-18,75,75,75,75,75,75,75,75,75,75,]),'<':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[76,76,-3,-5,-6,-7,-8,-56,76,76,-65,-100,-83,-97,76,76,76,76,-99,-68,76,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,76,-57,-64,76,76,76,76,76,76,76,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,76,76,-58,76,76,-48,76,76,-18,76,76,76,76,76,76,76,76,76,76,]),'>':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[77,77,-3,-5,-6,-7,-8,-56,77,77,-65,-100,-83,-97,77,77,77,77,-99,-68,77,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,77,-57,-64,77,77,77,77,77,77,77,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,77,77,-58,77,77,-48,77,77,-18,77,77,77,77,77,77,77,77,77,77,]),'^':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[78,78,-3,-5,-6,-7,-8,-56,78,78,-65,-100,-83,-97,78,78,78,78,-99,-68,78,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,78,-57,-64,78,78,78,78,78,78,78,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,78,78,-58,78,78,-48,78,78,-18,78,78,78,78,78,78,78,78,78,78,]),'|':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[79,79,-3,-5,-6,-7,-8,-56,79,79,-65,-100,-83,-97,79,79,79,79,-99,-68,79,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,79,-57,-64,79,79,79,79,79,79,79,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,79,79,-58,79,79,-48,79,79,-18,79,79,79,79,79,79,79,79,79,79,]),'?':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[80,80,-3,-5,-6,-7,-8,-56,80,80,-65,-100,-83,-97,80,80,80,80,-99,-68,80,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,80,-57,-64,80,80,80,80,80,80,80,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,80,80,-58,80,80,-48,80,80,-18,80,80,80,80,80,80,80,80,80,80,]),'"':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[81,81,-3,-5,-6,-7,-8,-56,81,81,-65,-100,-83,-97,81,81,81,81,-99,-68,81,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,81,-57,-64,81,81,81,81,81,81,81,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,81,81,-58,81,81,-48,81,81,-18,81,81,81,81,81,81,81,81,81,81,]),'@':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[82,82,-3,-5,-6,-7,-8,-56,82,82,-65,-100,-83,-97,82,82,82,82,-99,-68,82,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,82,-57,-64,82,82,82,82,82,82,82,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,82,82,-58,82,82,-48,82,82,-18,82,82,82,82,82,82,82,82,82,82,]),'#':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,109,110,111,112,113,114,115,116,117,120,123,124,125,127,128,131,133,134,135,136,137,138,139,141,145,146,147,148,150,152,157,],[83,83,-3,-5,-6,-7,-8,-56,83,83,-65,-100,-83,-97,83,83,83,83,-99,-68,83,-63,-66,-67,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-4,-9,-10,-11,-12,-13,-14,-15,83,-57,-64,83,83,83,83,83,83,83,-47,-49,-50,-51,-52,-53,-54,-55,-16,-17,-31,83,83,-58,83,83,-48,83,83,-18,83,83,83,83,83,83,83,83,83,83,]),'ENDIF':([3,4,5,6,7,9,15,84,85,86,87,88,89,90,91,92,93,95,98,120,121,122,123,124,125,128,133,135,136,137,138,139,145,146,147,148,],[-3,-5,-6,-7,-8,-56,94,-4,-9,-10,-11,-12,-13,-14,-15,94,94,-25,-57,-16,94,-26,-17,-31,-29,-58,-19,-21,-23,-18,-30,-27,-20,-22,-24,-28,]),'ELSE':([3,4,5,6,7,9,15,84,85,86,87,88,89,90,91,92,95,98,120,122,123,124,128,133,135,136,137,139,145,146,147,148,],[-3,-5,-6,-7,-8,-56,96,-4,-9,-10,-11,-12,-13,-14,-15,96,-25,-57,-16,-26,-17,-31,-58,-19,-21,-23,-18,-27,-20,-22,-24,-28,]),'ELIF':([3,4,5,6,7,9,15,84,85,86,87,88,89,90,91,92,95,98,120,122,123,124,128,133,135,136,137,139,145,146,147,148,],[-3,-5,-6,-7,-8,-56,97,-4,-9,-10,-11,-12,-13,-14,-15,97,-25,-57,-16,-26,-17,-31,-58,-19,-21,-23,-18,-27,-20,-22,-24,-28,]),'DEFINED':([20,21,22,28,31,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,97,109,110,111,112,113,114,115,116,117,127,134,],[-100,-83,-97,-99,112,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,112,112,-47,-49,-50,-51,-52,-53,-54,-55,112,-48,]),'LPAREN':([20,21,22,28,31,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,97,101,109,110,111,112,113,114,115,116,117,127,134,],[-100,-83,-97,-99,116,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-98,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,116,130,116,-47,-49,-50,-51,-52,-53,-54,-55,116,-48,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'preprocessing_file':([0,],[1,]),'group':([0,125,133,135,136,139,],[2,138,145,146,147,148,]),'group_part':([0,2,125,133,135,136,138,139,145,146,147,148,],[3,84,3,3,3,3,84,3,84,84,84,84,]),'control_line':([0,2,125,133,135,136,138,139,145,146,147,148,],[4,4,4,4,4,4,4,4,4,4,4,4,]),'if_section':([0,2,125,133,135,136,138,139,145,146,147,148,],[5,5,5,5,5,5,5,5,5,5,5,5,]),'text_line':([0,2,125,133,135,136,138,139,145,146,147,148,],[6,6,6,6,6,6,6,6,6,6,6,6,]),'conditionally_supported_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[7,7,7,7,7,7,7,7,7,7,7,7,]),'define_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[8,8,8,8,8,8,8,8,8,8,8,8,]),'error_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[10,10,10,10,10,10,10,10,10,10,10,10,]),'include_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[11,11,11,11,11,11,11,11,11,11,11,11,]),'line_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[12,12,12,12,12,12,12,12,12,12,12,12,]),'pragma_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[13,13,13,13,13,13,13,13,13,13,13,13,]),'undef_directive':([0,2,125,133,135,136,138,139,145,146,147,148,],[14,14,14,14,14,14,14,14,14,14,14,14,]),'if_group':([0,2,125,133,135,136,138,139,145,146,147,148,],[15,15,15,15,15,15,15,15,15,15,15,15,]),'token_list':([0,2,17,23,24,25,26,101,125,133,135,136,138,139,141,145,146,147,148,150,152,157,],[16,16,100,102,103,104,105,131,16,16,16,16,16,16,131,16,16,16,16,131,131,131,]),'token':([0,2,16,17,23,24,25,26,100,101,102,103,104,105,125,131,133,135,136,138,139,141,145,146,147,148,150,152,157,],[34,34,99,34,34,34,34,34,99,34,99,99,99,99,34,99,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'operator_punc':([0,2,16,17,23,24,25,26,31,97,100,101,102,103,104,105,109,125,127,131,133,135,136,138,139,141,145,146,147,148,150,152,157,],[37,37,37,37,37,37,37,37,117,117,37,37,37,37,37,37,117,37,117,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'endif_line':([15,92,93,121,],[91,120,123,137,]),'elif_groups':([15,],[92,]),'else_group':([15,92,],[93,121,]),'elif_group':([15,92,],[95,122,]),'constant_expression':([31,],[108,]),'if_token_list':([31,97,],[109,127,]),'if_token':([31,97,109,127,],[110,110,134,134,]),'elif_expression':([97,],[126,]),'replacement_list':([101,141,150,152,157,],[129,149,153,156,158,]),'identifier_list':([130,],[142,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> preprocessing_file","S'",1,None,None,None),
+  ('preprocessing_file -> <empty>','preprocessing_file',0,'p_preprocessing_file','c99_preprocessor.py',511),
+  ('preprocessing_file -> group','preprocessing_file',1,'p_preprocessing_file','c99_preprocessor.py',512),
+  ('group -> group_part','group',1,'p_group','c99_preprocessor.py',522),
+  ('group -> group group_part','group',2,'p_group_2','c99_preprocessor.py',532),
+  ('group_part -> control_line','group_part',1,'p_group_part','c99_preprocessor.py',541),
+  ('group_part -> if_section','group_part',1,'p_group_part','c99_preprocessor.py',542),
+  ('group_part -> text_line','group_part',1,'p_group_part','c99_preprocessor.py',543),
+  ('group_part -> conditionally_supported_directive','group_part',1,'p_group_part','c99_preprocessor.py',544),
+  ('control_line -> define_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',551),
+  ('control_line -> error_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',552),
+  ('control_line -> include_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',553),
+  ('control_line -> line_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',554),
+  ('control_line -> pragma_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',555),
+  ('control_line -> undef_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',556),
+  ('if_section -> if_group endif_line','if_section',2,'p_if_section','c99_preprocessor.py',563),
+  ('if_section -> if_group elif_groups endif_line','if_section',3,'p_if_section2','c99_preprocessor.py',575),
+  ('if_section -> if_group else_group endif_line','if_section',3,'p_if_section3','c99_preprocessor.py',592),
+  ('if_section -> if_group elif_groups else_group endif_line','if_section',4,'p_if_section4','c99_preprocessor.py',606),
+  ('if_group -> IF constant_expression NEWLINE','if_group',3,'p_if_group','c99_preprocessor.py',629),
+  ('if_group -> IF constant_expression NEWLINE group','if_group',4,'p_if_group','c99_preprocessor.py',630),
+  ('if_group -> IFDEF IDENTIFIER NEWLINE','if_group',3,'p_if_group2','c99_preprocessor.py',644),
+  ('if_group -> IFDEF IDENTIFIER NEWLINE group','if_group',4,'p_if_group2','c99_preprocessor.py',645),
+  ('if_group -> IFNDEF IDENTIFIER NEWLINE','if_group',3,'p_if_group3','c99_preprocessor.py',661),
+  ('if_group -> IFNDEF IDENTIFIER NEWLINE group','if_group',4,'p_if_group3','c99_preprocessor.py',662),
+  ('elif_groups -> elif_group','elif_groups',1,'p_elif_groups','c99_preprocessor.py',678),
+  ('elif_groups -> elif_groups elif_group','elif_groups',2,'p_elif_groups_2','c99_preprocessor.py',685),
+  ('elif_group -> ELIF elif_expression NEWLINE','elif_group',3,'p_elif_group','c99_preprocessor.py',693),
+  ('elif_group -> ELIF elif_expression NEWLINE group','elif_group',4,'p_elif_group','c99_preprocessor.py',694),
+  ('else_group -> ELSE NEWLINE','else_group',2,'p_else_group','c99_preprocessor.py',709),
+  ('else_group -> ELSE NEWLINE group','else_group',3,'p_else_group','c99_preprocessor.py',710),
+  ('endif_line -> ENDIF NEWLINE','endif_line',2,'p_endif_line','c99_preprocessor.py',722),
+  ('define_directive -> DEFINE IDENTIFIER replacement_list','define_directive',3,'p_define_directive','c99_preprocessor.py',730),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN ) replacement_list','define_directive',5,'p_define_directive_2','c99_preprocessor.py',741),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN identifier_list ) replacement_list','define_directive',6,'p_define_directive_3','c99_preprocessor.py',752),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN ELLIPSIS ) replacement_list','define_directive',6,'p_define_directive_4','c99_preprocessor.py',763),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN identifier_list , ELLIPSIS ) replacement_list','define_directive',8,'p_define_directive_5','c99_preprocessor.py',774),
+  ('error_directive -> ERROR','error_directive',1,'p_error_directive','c99_preprocessor.py',785),
+  ('error_directive -> ERROR token_list','error_directive',2,'p_error_directive','c99_preprocessor.py',786),
+  ('include_directive -> INCLUDE token_list','include_directive',2,'p_include_directive','c99_preprocessor.py',799),
+  ('line_directive -> LINE token_list','line_directive',2,'p_line_directive','c99_preprocessor.py',811),
+  ('pragma_directive -> PRAGMA','pragma_directive',1,'p_pragma_directive','c99_preprocessor.py',824),
+  ('pragma_directive -> PRAGMA token_list','pragma_directive',2,'p_pragma_directive','c99_preprocessor.py',825),
+  ('pragma_directive -> _PRAGMA ( STRING_LITERAL )','pragma_directive',4,'p_pragma_directive','c99_preprocessor.py',826),
+  ('undef_directive -> UNDEF IDENTIFIER','undef_directive',2,'p_undef_directive','c99_preprocessor.py',838),
+  ('constant_expression -> if_token_list','constant_expression',1,'p_constant_expression','c99_preprocessor.py',849),
+  ('elif_expression -> if_token_list','elif_expression',1,'p_elif_expression','c99_preprocessor.py',861),
+  ('if_token_list -> if_token','if_token_list',1,'p_if_token_list','c99_preprocessor.py',873),
+  ('if_token_list -> if_token_list if_token','if_token_list',2,'p_if_token_list_2','c99_preprocessor.py',880),
+  ('if_token -> IDENTIFIER','if_token',1,'p_if_token','c99_preprocessor.py',888),
+  ('if_token -> DEFINED','if_token',1,'p_if_token','c99_preprocessor.py',889),
+  ('if_token -> CONSTANT','if_token',1,'p_if_token','c99_preprocessor.py',890),
+  ('if_token -> STRING_LITERAL','if_token',1,'p_if_token','c99_preprocessor.py',891),
+  ('if_token -> HEADER_NAME','if_token',1,'p_if_token','c99_preprocessor.py',892),
+  ('if_token -> LPAREN','if_token',1,'p_if_token','c99_preprocessor.py',893),
+  ('if_token -> operator_punc','if_token',1,'p_if_token','c99_preprocessor.py',894),
+  ('text_line -> NEWLINE','text_line',1,'p_text_line','c99_preprocessor.py',902),
+  ('text_line -> token_list NEWLINE','text_line',2,'p_text_line','c99_preprocessor.py',903),
+  ('conditionally_supported_directive -> DIRECTIVE token_list NEWLINE','conditionally_supported_directive',3,'p_conditionally_supported_directive','c99_preprocessor.py',913),
+  ('identifier_list -> IDENTIFIER','identifier_list',1,'p_identifier_list','c99_preprocessor.py',919),
+  ('identifier_list -> identifier_list , IDENTIFIER','identifier_list',3,'p_identifier_list_2','c99_preprocessor.py',927),
+  ('replacement_list -> <empty>','replacement_list',0,'p_replacement_list','c99_preprocessor.py',935),
+  ('replacement_list -> token_list','replacement_list',1,'p_replacement_list','c99_preprocessor.py',936),
+  ('token_list -> token','token_list',1,'p_token_list','c99_preprocessor.py',944),
+  ('token_list -> token_list token','token_list',2,'p_token_list_2','c99_preprocessor.py',952),
+  ('token -> IDENTIFIER','token',1,'p_token','c99_preprocessor.py',971),
+  ('token -> HEADER_NAME','token',1,'p_token2','c99_preprocessor.py',1003),
+  ('token -> CONSTANT','token',1,'p_token2','c99_preprocessor.py',1004),
+  ('token -> STRING_LITERAL','token',1,'p_token2','c99_preprocessor.py',1005),
+  ('token -> operator_punc','token',1,'p_token2','c99_preprocessor.py',1006),
+  ('operator_punc -> =','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1011),
+  ('operator_punc -> AND_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1012),
+  ('operator_punc -> MUL_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1013),
+  ('operator_punc -> DIV_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1014),
+  ('operator_punc -> MOD_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1015),
+  ('operator_punc -> ADD_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1016),
+  ('operator_punc -> SUB_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1017),
+  ('operator_punc -> LEFT_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1018),
+  ('operator_punc -> RIGHT_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1019),
+  ('operator_punc -> AND_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1020),
+  ('operator_punc -> XOR_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1021),
+  ('operator_punc -> OR_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1022),
+  ('operator_punc -> DEC_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1023),
+  ('operator_punc -> ELLIPSIS','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1024),
+  ('operator_punc -> EQ_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1025),
+  ('operator_punc -> GE_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1026),
+  ('operator_punc -> INC_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1027),
+  ('operator_punc -> LEFT_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1028),
+  ('operator_punc -> LE_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1029),
+  ('operator_punc -> NE_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1030),
+  ('operator_punc -> HASH_HASH','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1031),
+  ('operator_punc -> PTR_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1032),
+  ('operator_punc -> OR_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1033),
+  ('operator_punc -> RIGHT_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1034),
+  ('operator_punc -> ;','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1035),
+  ('operator_punc -> {','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1036),
+  ('operator_punc -> }','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1037),
+  ('operator_punc -> ,','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1038),
+  ('operator_punc -> :','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1039),
+  ('operator_punc -> (','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1040),
+  ('operator_punc -> )','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1041),
+  ('operator_punc -> [','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1042),
+  ('operator_punc -> ]','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1043),
+  ('operator_punc -> .','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1044),
+  ('operator_punc -> &','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1045),
+  ('operator_punc -> !','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1046),
+  ('operator_punc -> ~','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1047),
+  ('operator_punc -> -','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1048),
+  ('operator_punc -> +','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1049),
+  ('operator_punc -> *','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1050),
+  ('operator_punc -> /','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1051),
+  ('operator_punc -> %','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1052),
+  ('operator_punc -> <','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1053),
+  ('operator_punc -> >','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1054),
+  ('operator_punc -> ^','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1055),
+  ('operator_punc -> |','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1056),
+  ('operator_punc -> ?','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1057),
+  ('operator_punc -> "','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1058),
+  ('operator_punc -> @','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1059),
+  ('operator_punc -> #','operator_punc',1,'p_operator_punc','c99_preprocessor.py',1060),
+]
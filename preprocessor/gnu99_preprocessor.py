@@ -29,11 +29,12 @@ class GNU99PreProcessor(C99PreProcessor):
         if header_name[0] == '<' and header_name[-1] == '>':
             line_control_start_flag.append(PreProcessorFlags.SYSTEM_HEADER)
 
-        include_content = self._create_line_control(header_name[1:-1], line_control_start_flag)
-        include_content += super(GNU99PreProcessor, self).include(header_name)
-        include_content += self._create_line_control(os.path.basename(self._current_file), [PreProcessorFlags.RETURN_TO_FILE])
-
-        return include_content
+        # Header content is surrounded by line controls, joined once instead of growing a string.
+        return ''.join([
+                            self._create_line_control(header_name[1:-1], line_control_start_flag),
+                            super(GNU99PreProcessor, self).include(header_name),
+                            self._create_line_control(os.path.basename(self._current_file), [PreProcessorFlags.RETURN_TO_FILE]),
+                       ])
     
     # TODO: Add missing line control. GNU preprocessor adds a line control when returning/starting to preprocess of the current file.
     # TODO: Add missing line control when extern "C" is encountered.
@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+
+from preprocessor.c99_preprocessor import C99ConstantExpression, C99PreProcessor
+
+
+class C99ConstantExpressionTest(unittest.TestCase):
+
+    def evaluate(self, *token_list):
+        return C99ConstantExpression(list(token_list)).evaluate()
+
+    def test_precedence(self):
+        self.assertEqual(self.evaluate(1, '+', 2, '*', 3), 7)
+        self.assertEqual(self.evaluate('(', 1, '+', 2, ')', '*', 3), 9)
+        self.assertEqual(self.evaluate(1, '<<', 2, '+', 1), 8)
+        self.assertEqual(self.evaluate(1, '|', 2, '==', 2), 1)
+
+    def test_unary(self):
+        self.assertEqual(self.evaluate('-', 3, '+', 5), 2)
+        self.assertEqual(self.evaluate('!', 0), 1)
+        self.assertEqual(self.evaluate('~', 0), -1)
+
+    def test_division_truncates_toward_zero(self):
+        self.assertEqual(self.evaluate('-', 7, '/', 2), -3)
+        self.assertEqual(self.evaluate('-', 7, '%', 2), -1)
+
+    def test_relational_yield_int(self):
+        value = self.evaluate(2, '>', 1)
+
+        self.assertEqual(value, 1)
+        self.assertIs(type(value), int)
+        self.assertEqual(self.evaluate('(', 1, '<', 2, ')', '+', '(', 2, '!=', 2, ')'), 1)
+
+    def test_short_circuit(self):
+        self.assertEqual(self.evaluate(0, '&&', 1, '/', 0), 0)
+        self.assertEqual(self.evaluate(1, '||', 1, '/', 0), 1)
+        self.assertEqual(self.evaluate(1, '?', 2, ':', 1, '/', 0), 2)
+        self.assertEqual(self.evaluate(0, '?', 1, '/', 0, ':', 3), 3)
+
+    def test_remaining_identifier_is_zero(self):
+        self.assertEqual(self.evaluate('UNDEFINED', '+', 1), 1)
+
+    def test_invalid_expression(self):
+        with self.assertRaises(Exception):
+            self.evaluate(1, '+')
+
+        with self.assertRaises(Exception):
+            self.evaluate(1, 2)
+
+        with self.assertRaises(ZeroDivisionError):
+            self.evaluate(1, '/', 0)
+
+
+class C99ConditionTest(unittest.TestCase):
+
+    def preprocess(self, content):
+        file_descriptor, file_path = tempfile.mkstemp(suffix = ".c")
+
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(content)
+
+        try:
+            return C99PreProcessor().process(file_path).split()
+        finally:
+            os.remove(file_path)
+
+    def test_nested_condition_uses_enclosing_defines(self):
+        output = self.preprocess("#ifndef H\n"
+                                 "#define H\n"
+                                 "#define FEATURE 1\n"
+                                 "#if FEATURE\n"
+                                 "int feature;\n"
+                                 "#endif\n"
+                                 "#if !FEATURE\n"
+                                 "int not_feature;\n"
+                                 "#endif\n"
+                                 "#endif\n")
+
+        self.assertEqual(output, ["int", "feature", ";"])
+
+    def test_deeply_nested_conditions(self):
+        output = self.preprocess("#define A 1\n"
+                                 "#ifdef A\n"
+                                 "#define B 2\n"
+                                 "#if A\n"
+                                 "#if B == 2\n"
+                                 "int both;\n"
+                                 "#else\n"
+                                 "int only_a;\n"
+                                 "#endif\n"
+                                 "#endif\n"
+                                 "#endif\n")
+
+        self.assertEqual(output, ["int", "both", ";"])
+
+    def test_elif_after_taken_branch_is_not_evaluated(self):
+        output = self.preprocess("#if 1\n"
+                                 "int first;\n"
+                                 "#elif 1 / 0\n"
+                                 "int second;\n"
+                                 "#endif\n")
+
+        self.assertEqual(output, ["int", "first", ";"])
+
+    def test_skipped_nested_condition_is_not_evaluated(self):
+        output = self.preprocess("#ifdef __has_include\n"
+                                 "#if __has_include(<missing.h>)\n"
+                                 "int missing;\n"
+                                 "#endif\n"
+                                 "#endif\n"
+                                 "int end;\n")
+
+        self.assertEqual(output, ["int", "end", ";"])
+
+    def test_invalid_nested_condition_raises(self):
+        for condition in ("1 +", "1 / 0"):
+            with self.subTest(condition = condition):
+                with self.assertRaises(Exception):
+                    self.preprocess("#ifndef H\n"
+                                    "#define H\n"
+                                    f"#if {condition}\n"
+                                    "int a;\n"
+                                    "#else\n"
+                                    "int b;\n"
+                                    "#endif\n"
+                                    "#endif\n")
+
+    def test_integer_suffix(self):
+        output = self.preprocess("#define BIG 0xffffffffUL\n"
+                                 "#if BIG > 5 && 1ULL == 1llu\n"
+                                 "int big;\n"
+                                 "#endif\n")
+
+        self.assertEqual(output, ["int", "big", ";"])
+
+
+if __name__ == '__main__':
+    unittest.main()